@@ -4,7 +4,7 @@ import random
 from dataclasses import dataclass, field
 
 from .hex import bfs_next_step, hex_distance
-from .overworld import FACTIONS, UNIT_STATS
+from .overworld import FACTIONS, UNIT_STATS, Overworld
 
 
 @dataclass
@@ -196,8 +196,6 @@ class AIController:
 
         Returns: (new_pos, target_army) if combat should occur, else (new_pos, None)
         """
-        from .overworld import Overworld
-
         army_key = id(army)
         target_moniker = state.targets.get(army_key)
 
@@ -242,10 +240,11 @@ class AIController:
                 return army.pos, target_army
 
         # Build set of occupied hexes (other armies, but not our target)
-        occupied = set()
-        for a in world.armies:
-            if a is not army and a.pos != target_pos:
-                occupied.add(a.pos)
+        occupied = set(world.armies.positions())
+        occupied.discard(target_pos)
+        if len(world.armies.at(army.pos)) == 1:
+            # Only this army stands here
+            occupied.discard(army.pos)
 
         # Get next step toward goal
         next_pos = bfs_next_step(
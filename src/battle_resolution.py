@@ -1,5 +1,7 @@
 """Shared battle resolution helpers for overworld and server."""
 
+from collections import Counter
+
 
 def make_battle_units(army, effective_stats, display_name_fn=None, armor_bonus=0):
     """Convert an OverworldArmy's unit list into Battle-compatible dicts.
@@ -32,14 +34,13 @@ def make_battle_units(army, effective_stats, display_name_fn=None, armor_bonus=0
 
 def update_survivors(army, battle, battle_player):
     """Update an OverworldArmy's unit list to reflect battle survivors."""
-    survivor_counts = {}
-    for u in battle.units:
-        if u.alive and u.player == battle_player:
-            survivor_counts[u.name] = survivor_counts.get(u.name, 0) + 1
+    survivor_counts = Counter(
+        u.name for u in battle.units if u.alive and u.player == battle_player
+    )
     army.units = [
-        (name, survivor_counts.get(name, 0))
+        (name, survivor_counts[name])
         for name, _ in army.units
-        if survivor_counts.get(name, 0) > 0
+        if survivor_counts[name] > 0
     ]
 
 
@@ -1,5 +1,7 @@
 import random
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import groupby
 from typing import Optional
 from .constants import (
     COMBAT_P1_ZONE_END,
@@ -8,8 +10,8 @@ from .constants import (
 from .hex import (
     hex_distance,
     hex_neighbors,
+    bfs_distance_field,
     bfs_next_step,
-    bfs_path_length,
     bfs_speed_move,
 )
 
@@ -103,9 +105,6 @@ class BattleSetup:
             descending_col: True for P1 (high cols first), False for P2
             rng: Random instance for shuffling
         """
-        from collections import defaultdict
-        from itertools import groupby
-
         by_col = defaultdict(list)
         for c, r in positions:
             by_col[c].append((c, r))
@@ -273,12 +272,17 @@ class Battle:
         self.rng_seed = rng_seed
         self.rng = random.Random(rng_seed)
         self._init_rng_state = self.rng.getstate()
-        self._unit_id_counter = 0
         self.apply_events_immediately = apply_events_immediately
         self._record_history = record_history
         self.p1_combat_rules = p1_combat_rules or {}
         self.p2_combat_rules = p2_combat_rules or {}
         self.ROWS = BattleSetup.compute_rows(p1_units, p2_units)
+        self.reset()
+
+    def reset(self):
+        """Restore the battle to its initial state, keeping seed, armies and rules."""
+        self.rng.setstate(self._init_rng_state)
+        self._unit_id_counter = 0
         self.units = []
         self.turn_order = []
         self.current_index = 0
@@ -286,10 +290,11 @@ class Battle:
         self.log = []
         self.winner = None
         self.history = []
+        self.last_action = None
         self._prev_round_state = None
         self._stalemate_count = 0
         self._pending_effects = []  # Queue for deferred effect application
-        self._setup_armies(p1_units, p2_units)
+        self._setup_armies(self._init_p1_units, self._init_p2_units)
         self._new_round()
 
     def _next_unit_id(self):
@@ -1026,16 +1031,15 @@ class Battle:
             ):
                 self._queue_event(EVENT_SPLASH, attacker, enemy, amount)
 
-    def _shadowstep_destination(self, unit, enemies, occupied):
-        """Find a hex adjacent to the furthest enemy unit."""
-        if not enemies:
+    def _shadowstep_destination(self, enemy_dists, occupied):
+        """Find a hex adjacent to the furthest enemy unit.
+
+        enemy_dists holds (path length, enemy) pairs from the moving unit.
+        """
+        if not enemy_dists:
             return None
-        distances = [
-            (bfs_path_length(unit.pos, e.pos, occupied, self.COLS, self.ROWS), e)
-            for e in enemies
-        ]
-        furthest_dist = max(d for d, _ in distances)
-        furthest = [e for d, e in distances if d == furthest_dist]
+        furthest_dist = max(d for d, _ in enemy_dists)
+        furthest = [e for d, e in enemy_dists if d == furthest_dist]
         target_enemy = self.rng.choice(furthest)
         adj = hex_neighbors(
             target_enemy.pos[0], target_enemy.pos[1], self.COLS, self.ROWS
@@ -1181,11 +1185,11 @@ class Battle:
         occupied = self._occupied() - {unit.pos}
         old_pos = unit.pos
 
-        # Find closest enemy by path length
-        enemy_dists = [
-            (bfs_path_length(unit.pos, e.pos, occupied, self.COLS, self.ROWS), e)
-            for e in enemies
-        ]
+        # Find closest enemy by path length; one distance field serves every
+        # enemy (and the shadowstep check below)
+        cols = self.COLS
+        field = bfs_distance_field(unit.pos, cols, self.ROWS, occupied)
+        enemy_dists = [(field[e.pos[1] * cols + e.pos[0]], e) for e in enemies]
         closest_dist = min(d for d, _ in enemy_dists)
         closest = [e for d, e in enemy_dists if d == closest_dist]
         target_enemy = self.rng.choice(closest)
@@ -1203,7 +1207,7 @@ class Battle:
         for idx, ab in enumerate(unit.abilities):
             if ab.get("trigger") == "turnstart" and ab.get("effect") == "shadowstep":
                 if self._charge_ready(unit, idx, ab):
-                    shadow_pos = self._shadowstep_destination(unit, enemies, occupied)
+                    shadow_pos = self._shadowstep_destination(enemy_dists, occupied)
                     if shadow_pos:
                         unit.pos = shadow_pos
                         shadowstepped = True
@@ -15,6 +15,18 @@ from .combat import Battle
 from .heroes import HERO_STATS
 from .hex import hex_distance
 
+# Arrowhead barbs sit 150 degrees either side of the flight direction
+_ARROW_HEAD_ANGLE = math.radians(150)
+
+# Unit vectors for the two diagonal strokes of the splash-hit "X"
+_SPLASH_DIRS = tuple(
+    (math.cos(math.radians(deg)), math.sin(math.radians(deg))) for deg in (45, 135)
+)
+
+# At or below this auto-step delay (the fastest speed level) effects are
+# applied without animating them
+_SKIP_ANIM_THRESHOLD_MS = 25
+
 
 # --- GUI ---
 
@@ -226,6 +238,8 @@ class CombatGUI:
         self.on_complete = on_complete
         self.attacker_player = attacker_player
         self.defender_player = defender_player
+        # HEX_SIZE is fixed, so hex centers never change for this view
+        self._hex_coord_cache = {}
 
         # layout
         top = tk.Frame(root)
@@ -305,6 +319,7 @@ class CombatGUI:
 
         self.return_btn = None
         self.auto_running = False
+        self._draw_scheduled = False
         self._tooltip = None
         self._tooltip_unit = None
         self.canvas.bind("<Motion>", self._on_hover)
@@ -374,6 +389,14 @@ class CombatGUI:
     def _hex_y(self, col, row):
         return self.HEX_SIZE * HEX_ROW_SPACING * row + 30
 
+    def _hex_xy(self, pos):
+        """Return the (x, y) pixel center of a hex, cached per (col, row)."""
+        pt = self._hex_coord_cache.get(pos)
+        if pt is None:
+            pt = (self._hex_x(pos[0], pos[1]), self._hex_y(pos[0], pos[1]))
+            self._hex_coord_cache[pos] = pt
+        return pt
+
     def _hex_polygon(self, cx, cy):
         points = []
         for i in range(6):
@@ -389,8 +412,7 @@ class CombatGUI:
         # draw grid
         for r in range(b.ROWS):
             for c in range(b.COLS):
-                cx = self._hex_x(c, r)
-                cy = self._hex_y(c, r)
+                cx, cy = self._hex_xy((c, r))
                 if c < COMBAT_P1_ZONE_END:
                     fill = "#3a3a5c"
                 elif c >= COMBAT_P2_ZONE_START:
@@ -424,8 +446,7 @@ class CombatGUI:
                             hex_distance(u.pos, (c2, r2)) <= aura_range
                             and (c2, r2) != u.pos
                         ):
-                            ax = self._hex_x(c2, r2)
-                            ay = self._hex_y(c2, r2)
+                            ax, ay = self._hex_xy((c2, r2))
                             self.canvas.create_polygon(
                                 self._hex_polygon(ax, ay),
                                 fill="",
@@ -439,8 +460,7 @@ class CombatGUI:
         for u in b.units:
             if not u.alive:
                 continue
-            cx = self._hex_x(u.pos[0], u.pos[1])
-            cy = self._hex_y(u.pos[0], u.pos[1])
+            cx, cy = self._hex_xy(u.pos)
             sprite_name = u.name.lower()
             sprite = self._get_sprite(sprite_name, u.has_acted or u._frozen_turns > 0)
             self._sprite_refs.append(sprite)
@@ -516,6 +536,26 @@ class CombatGUI:
         # update log
         self._update_log_display()
 
+    def _request_draw(self):
+        """Schedule a redraw for the next idle turn, coalescing repeated requests."""
+        if self._draw_scheduled:
+            return
+        self._draw_scheduled = True
+        self.root.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        """Run a pending redraw now; a no-op if it has already been flushed.
+
+        Animations call this before drawing their first frame, since the
+        redraw clears the whole canvas and would erase a frame drawn earlier.
+        """
+        if not self._draw_scheduled:
+            return
+        self._draw_scheduled = False
+        if not self.canvas.winfo_exists():
+            return  # combat view was torn down before the idle callback ran
+        self._draw()
+
     def _draw_crown(self, cx, cy):
         """Draw a small crown at the top-left of the unit's hex."""
         x = cx - self.HEX_SIZE * 0.65
@@ -547,8 +587,7 @@ class CombatGUI:
         for u in self.battle.units:
             if not u.alive:
                 continue
-            cx = self._hex_x(u.pos[0], u.pos[1])
-            cy = self._hex_y(u.pos[0], u.pos[1])
+            cx, cy = self._hex_xy(u.pos)
             d = math.hypot(px - cx, py - cy)
             if d < self.HEX_SIZE * 0.8 and d < best_dist:
                 best_dist = d
@@ -680,8 +719,8 @@ class CombatGUI:
             return
 
         t = frame / total_frames
-        sx, sy = self._hex_x(src[0], src[1]), self._hex_y(src[0], src[1])
-        dx, dy = self._hex_x(dst[0], dst[1]), self._hex_y(dst[0], dst[1])
+        sx, sy = self._hex_xy(src)
+        dx, dy = self._hex_xy(dst)
         cx = sx + (dx - sx) * t
         cy = sy + (dy - sy) * t
 
@@ -694,8 +733,8 @@ class CombatGUI:
             tail_x, tail_y, cx, cy, fill="#ffff44", width=2, tags="anim"
         )
         # Arrowhead
-        ha1 = angle + math.radians(150)
-        ha2 = angle - math.radians(150)
+        ha1 = angle + _ARROW_HEAD_ANGLE
+        ha2 = angle - _ARROW_HEAD_ANGLE
         self.canvas.create_polygon(
             cx,
             cy,
@@ -719,10 +758,8 @@ class CombatGUI:
             on_done()
             return
 
-        tx = self._hex_x(target_pos[0], target_pos[1])
-        ty = self._hex_y(target_pos[0], target_pos[1])
-        ax = self._hex_x(attacker_pos[0], attacker_pos[1])
-        ay = self._hex_y(attacker_pos[0], attacker_pos[1])
+        tx, ty = self._hex_xy(target_pos)
+        ax, ay = self._hex_xy(attacker_pos)
         # Place slash 40% of the way from target toward attacker
         cx = tx + (ax - tx) * 0.4
         cy = ty + (ay - ty) * 0.4
@@ -759,8 +796,8 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        cx = self._hex_x(pos[0], pos[1])
-        cy = self._hex_y(pos[0], pos[1]) - t * 12  # float upward
+        cx, cy = self._hex_xy(pos)
+        cy -= t * 12  # float upward
         alpha = int(255 * (1 - t))
         green = f"#00{alpha:02x}00"
         self.canvas.delete("heal_anim")
@@ -780,8 +817,8 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        cx = self._hex_x(pos[0], pos[1])
-        cy = self._hex_y(pos[0], pos[1]) + direction * t * 10
+        cx, cy = self._hex_xy(pos)
+        cy += direction * t * 10
         alpha_frac = 1 - t
         self.canvas.delete(tag)
         # Arrow shaft
@@ -819,22 +856,24 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        cx = self._hex_x(pos[0], pos[1])
-        cy = self._hex_y(pos[0], pos[1])
-        self.canvas.delete("splash_anim")
+        cx, cy = self._hex_xy(pos)
         r = self.HEX_SIZE * 0.3 * (0.5 + t * 0.5)
         fade = int(255 * (1 - t))
         color = f"#ff{fade // 4:02x}{fade // 4:02x}"
-        # Small expanding X
-        for angle_deg in (45, 135):
-            angle = math.radians(angle_deg)
-            x1 = cx + r * math.cos(angle)
-            y1 = cy + r * math.sin(angle)
-            x2 = cx - r * math.cos(angle)
-            y2 = cy - r * math.sin(angle)
-            self.canvas.create_line(
-                x1, y1, x2, y2, fill=color, width=2, tags="splash_anim"
-            )
+        # Small expanding X; reuse the stroke items between frames unless a
+        # redraw has cleared them
+        items = self.canvas.find_withtag("splash_anim")
+        if len(items) != len(_SPLASH_DIRS):
+            self.canvas.delete("splash_anim")
+            items = [
+                self.canvas.create_line(0, 0, 0, 0, width=2, tags="splash_anim")
+                for _ in _SPLASH_DIRS
+            ]
+        for item, (cos_a, sin_a) in zip(items, _SPLASH_DIRS):
+            dx = r * cos_a
+            dy = r * sin_a
+            self.canvas.coords(item, cx + dx, cy + dy, cx - dx, cy - dy)
+            self.canvas.itemconfig(item, fill=color)
         self.root.after(
             self._anim_delay(35),
             lambda: self._animate_splash_hit(pos, on_done, frame + 1),
@@ -848,10 +887,8 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        tx = self._hex_x(target_pos[0], target_pos[1])
-        ty = self._hex_y(target_pos[0], target_pos[1])
-        sx = self._hex_x(source_pos[0], source_pos[1])
-        sy = self._hex_y(source_pos[0], source_pos[1])
+        tx, ty = self._hex_xy(target_pos)
+        sx, sy = self._hex_xy(source_pos)
         # Shift 30% toward source
         cx = tx + (sx - tx) * 0.3
         cy = ty + (sy - ty) * 0.3 + t * 8
@@ -880,8 +917,7 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        tx = self._hex_x(target_pos[0], target_pos[1])
-        ty = self._hex_y(target_pos[0], target_pos[1])
+        tx, ty = self._hex_xy(target_pos)
         # Match heal positioning: centered on target, floats upward over time
         self.canvas.delete("freeze_anim")
         ty = ty - t * 12
@@ -906,8 +942,8 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        sx, sy = self._hex_x(src[0], src[1]), self._hex_y(src[0], src[1])
-        dx, dy = self._hex_x(dst[0], dst[1]), self._hex_y(dst[0], dst[1])
+        sx, sy = self._hex_xy(src)
+        dx, dy = self._hex_xy(dst)
         cx = sx + (dx - sx) * t
         cy = sy + (dy - sy) * t
         self.canvas.delete("strike_anim")
@@ -917,8 +953,8 @@ class CombatGUI:
         self.canvas.create_line(
             tail_x, tail_y, cx, cy, fill="#ff8800", width=2, tags="strike_anim"
         )
-        ha1 = angle + math.radians(150)
-        ha2 = angle - math.radians(150)
+        ha1 = angle + _ARROW_HEAD_ANGLE
+        ha2 = angle - _ARROW_HEAD_ANGLE
         self.canvas.create_polygon(
             cx,
             cy,
@@ -945,11 +981,9 @@ class CombatGUI:
             on_done()
             return
         t = frame / total_frames
-        px = self._hex_x(pos[0], pos[1])
-        py = self._hex_y(pos[0], pos[1])
+        px, py = self._hex_xy(pos)
         if source_pos:
-            sx = self._hex_x(source_pos[0], source_pos[1])
-            sy = self._hex_y(source_pos[0], source_pos[1])
+            sx, sy = self._hex_xy(source_pos)
             px = px + (sx - px) * 0.3
             py = py + (sy - py) * 0.3
         cy = py + direction * t * 10
@@ -986,6 +1020,7 @@ class CombatGUI:
             return
         first = anim_fns[0]
         rest = anim_fns[1:]
+        self._flush_draw()
         first(lambda: self._chain_anims(rest, final_done))
 
     def _make_sunder_anim(self, event):
@@ -1073,6 +1108,7 @@ class CombatGUI:
     def _play_attack_anim(self, action, on_done):
         """Play the appropriate animation for an attack action, then call on_done."""
         attacker_pos = action.get("attacker_pos", action.get("to"))
+        self._flush_draw()
         if action["ranged"]:
             self._animate_arrow(attacker_pos, action["target_pos"], on_done)
         else:
@@ -1100,7 +1136,7 @@ class CombatGUI:
     def _apply_event(self, event, on_done):
         self.battle.apply_effect_event(event)
         event["_applied"] = True
-        self._draw()
+        self._request_draw()
         on_done()
 
     def _play_post_attack_anims(self, action, on_done):
@@ -1108,7 +1144,7 @@ class CombatGUI:
 
         def finalize():
             self._apply_all_events(action)
-            self._draw()
+            self._request_draw()
             on_done()
 
         self._play_heal_if_needed(
@@ -1118,7 +1154,7 @@ class CombatGUI:
     def on_step(self):
         self.battle.step()
         action = self.battle.last_action
-        self._draw()
+        self._request_draw()
         if action and action.get("type") in ("attack", "move_attack"):
             self._play_attack_anim(
                 action, lambda: self._play_post_attack_anims(action, lambda: None)
@@ -1136,12 +1172,7 @@ class CombatGUI:
         if self.return_btn:
             self.return_btn.destroy()
             self.return_btn = None
-        self.battle = Battle(
-            p1_units=self.battle._init_p1_units,
-            p2_units=self.battle._init_p2_units,
-            rng_seed=self.battle.rng_seed,
-        )
-        self.battle.apply_events_immediately = False
+        self.battle.reset()
         self._draw()
 
     def _speed_down(self):
@@ -1176,7 +1207,7 @@ class CombatGUI:
         if not self.auto_running:
             return
         cont = self.battle.step()
-        self._draw()
+        self._request_draw()
         action = self.battle.last_action
 
         def schedule_next():
@@ -1186,6 +1217,11 @@ class CombatGUI:
                 self.auto_running = False
                 self.auto_btn.config(text="Auto")
 
+        if self.auto_delay <= _SKIP_ANIM_THRESHOLD_MS:
+            self._apply_all_events(action)
+            schedule_next()
+            return
+
         if action and action.get("type") in ("attack", "move_attack"):
             self._play_attack_anim(
                 action, lambda: self._play_post_attack_anims(action, schedule_next)
@@ -1,7 +1,10 @@
 """Shared game logic used by both server and client."""
 
+import random
+
 from .constants import NEUTRAL_PLAYER
 from .heroes import HEROES_BY_FACTION, apply_hero_evolutions_to_stats
+from .overworld import UNIT_VALUES
 from .upgrades import apply_upgrades_to_unit_stats
 
 
@@ -36,9 +39,10 @@ def get_effective_unit_stats(
     if hero_evolutions:
         stats = apply_hero_evolutions_to_stats(stats, hero_evolutions)
 
-    faction_units = factions.get(
-        faction, list(base_unit_stats.keys())
-    ) + HEROES_BY_FACTION.get(faction, [])
+    faction_units = [
+        *factions.get(faction, base_unit_stats.keys()),
+        *HEROES_BY_FACTION.get(faction, ()),
+    ]
     return apply_upgrades_to_unit_stats(stats, upgrade_ids, faction_units)
 
 
@@ -59,3 +63,68 @@ def is_hidden_objective_guard(army, my_faction, get_objective_fn):
     if not objective:
         return False
     return objective.faction != my_faction
+
+
+def blocked_positions(world, moving_army, my_faction, get_objective_fn):
+    """Return the hexes that block moving_army's path.
+
+    Starts from the world's position index; only the mover's own hex and
+    objective hexes (where a guard may be hidden) can hold armies that do not
+    block, so only those are checked army by army.
+
+    Args:
+        world: the Overworld being moved in.
+        moving_army: the army that is moving, or None.
+        my_faction: the moving player's faction name.
+        get_objective_fn: callable(pos) -> Objective or None.
+
+    Returns:
+        A new set of positions holding at least one visible army other than
+        moving_army.
+    """
+    blocked = set(world.armies.positions())
+    suspects = {o.pos for o in world.objectives}
+    if moving_army is not None:
+        suspects.add(moving_army.pos)
+    for pos in suspects & blocked:
+        if all(
+            a is moving_army
+            or is_hidden_objective_guard(a, my_faction, get_objective_fn)
+            for a in world.get_armies_at(pos)
+        ):
+            blocked.discard(pos)
+    return blocked
+
+
+def auto_build_evenly(world, player_id, names):
+    """Spend all of a player's gold on units, spread evenly across types and bases.
+
+    Each unit is the affordable type with the least gold spent on it so far
+    (ties broken at random), built at the base with the least spent so far.
+
+    Args:
+        world: the Overworld to build in.
+        player_id: the player whose gold is spent.
+        names: unit type names to build from.
+    """
+    costs = {n: UNIT_VALUES[n] for n in names}
+    spent = dict.fromkeys(names, 0)
+    bases = world.get_player_bases(player_id)
+    base_spent = {b.pos: 0 for b in bases}
+    gold = world.gold
+    while gold.get(player_id, 0) > 0:
+        budget = gold[player_id]
+        affordable = [n for n in names if costs[n] <= budget]
+        if not affordable:
+            break
+        min_spent = min(spent[n] for n in affordable)
+        candidates = [n for n in affordable if spent[n] == min_spent]
+        name = random.choice(candidates)
+        spent[name] += costs[name]
+        if bases:
+            pos = min(base_spent, key=base_spent.get)
+            if world.build_unit_at_pos(player_id, name, pos):
+                break
+            base_spent[pos] += costs[name]
+        elif world.build_unit(player_id, name):
+            break
@@ -1,14 +1,29 @@
 """Generate simple pixel art sprites."""
 
-from PIL import Image
 import os
 
 SPRITE_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
-os.makedirs(SPRITE_DIR, exist_ok=True)
 
 T = (0, 0, 0, 0)  # transparent
 
 
+def _ensure_dir():
+    os.makedirs(SPRITE_DIR, exist_ok=True)
+
+
+def _save_sprite(pixels, filename):
+    """Upscale a 16x16 pixel grid to 32x32 and save it under SPRITE_DIR."""
+    from PIL import Image
+
+    _ensure_dir()
+    img = Image.new("RGBA", (16, 16))
+    for y, row in enumerate(pixels):
+        for x, c in enumerate(row):
+            img.putpixel((x, y), c)
+    img = img.resize((32, 32), Image.NEAREST)
+    img.save(os.path.join(SPRITE_DIR, filename))
+
+
 def make_footman():
     """16x16 pixel art: armored melee soldier with sword and shield."""
     B = (30, 30, 30, 255)
@@ -36,12 +51,7 @@ def make_footman():
         [T, T, T, T, T, BR, BR, T, T, BR, BR, T, T, T, T, T],
         [T, T, T, T, T, B, B, T, T, B, B, T, T, T, T, T],
     ]
-    img = Image.new("RGBA", (16, 16))
-    for y, row in enumerate(pixels):
-        for x, c in enumerate(row):
-            img.putpixel((x, y), c)
-    img = img.resize((32, 32), Image.NEAREST)
-    img.save(os.path.join(SPRITE_DIR, "footman.png"))
+    _save_sprite(pixels, "footman.png")
 
 
 def make_skirmisher():
@@ -72,12 +82,7 @@ def make_skirmisher():
         [T, T, T, T, T, BR, BR, T, T, BR, BR, T, T, T, T, T],
         [T, T, T, T, T, B, B, T, T, B, B, T, T, T, T, T],
     ]
-    img = Image.new("RGBA", (16, 16))
-    for y, row in enumerate(pixels):
-        for x, c in enumerate(row):
-            img.putpixel((x, y), c)
-    img = img.resize((32, 32), Image.NEAREST)
-    img.save(os.path.join(SPRITE_DIR, "skirmisher.png"))
+    _save_sprite(pixels, "skirmisher.png")
 
 
 if __name__ == "__main__":
@@ -110,12 +115,7 @@ if __name__ == "__main__":
             [T, T, T, T, T, B, B, T, T, B, B, T, T, T, T, T],
             [T, T, T, T, T, B, B, T, T, B, B, T, T, T, T, T],
         ]
-        img = Image.new("RGBA", (16, 16))
-        for y, row in enumerate(pixels):
-            for x, c in enumerate(row):
-                img.putpixel((x, y), c)
-        img = img.resize((32, 32), Image.NEAREST)
-        img.save(os.path.join(SPRITE_DIR, f"{name.lower()}.png"))
+        _save_sprite(pixels, f"{name.lower()}.png")
 
     # Faction palettes
     CUST_MAIN = (210, 170, 40, 255)
@@ -1,7 +1,5 @@
 """Hero definitions and helpers."""
 
-from copy import deepcopy
-
 from .ability_defs import ability
 
 HERO_STATS = {
@@ -124,15 +122,16 @@ HERO_STATS = {
 }
 
 HEROES_BY_FACTION = {
-    "Custodians": ["Watcher", "Neophyte", "Accursed"],
-    "Weavers": ["Enchantress", "Prodigy", "Scholar"],
-    "Artificers": ["Outcast", "Mercenary", "Tactician"],
-    "Purifiers": ["Maiden", "Aspirant", "Apostle"],
+    "Custodians": ("Watcher", "Neophyte", "Accursed"),
+    "Weavers": ("Enchantress", "Prodigy", "Scholar"),
+    "Artificers": ("Outcast", "Mercenary", "Tactician"),
+    "Purifiers": ("Maiden", "Aspirant", "Apostle"),
 }
 
 
 def get_heroes_for_faction(faction_name):
-    return list(HEROES_BY_FACTION.get(faction_name, []))
+    """Return the faction's hero names as a shared tuple; copy before mutating."""
+    return HEROES_BY_FACTION.get(faction_name, ())
 
 
 # Hero evolutions: maps base_hero -> evolved_form -> evolution data
@@ -340,27 +339,44 @@ def get_evolved_hero_stats(base_hero, evolutions, base_stats=None):
     if base_hero not in base_stats:
         return None
 
-    stats = deepcopy(base_stats[base_hero])
     path = get_hero_evolution_path(base_hero, evolutions)
+    base_entry = base_stats[base_hero]
+    # The precomputed table only covers the shared HERO_STATS entries; callers
+    # may pass tables whose entries differ from them
+    if base_entry is HERO_STATS.get(base_hero):
+        precomputed = _PRECOMPUTED_STATS.get((base_hero, tuple(path)))
+        if precomputed is not None:
+            return _copy_hero_stats(precomputed)
+
+    return _apply_evolution_path(base_entry, base_hero, path)
+
+
+def _apply_evolution_path(base_entry, base_hero, path):
+    """Return a copy of base_entry with each evolution in path applied in order."""
+    stats = _copy_hero_stats(base_entry)
 
     # Track the current form to look up evolutions
     current_form = base_hero
 
     for evolved_form in path:
-        evolution_data = HERO_EVOLUTIONS.get(current_form, {}).get(evolved_form)
-        if not evolution_data:
+        step = _EVOLUTION_STEPS.get((current_form, evolved_form))
+        if step is None:
             break
-
-        # Apply stat changes (additive)
-        for stat, delta in evolution_data.get("stat_changes", {}).items():
+        stat_changes, new_abilities = step
+        for stat, delta in stat_changes:
             stats[stat] = stats.get(stat, 0) + delta
+        if new_abilities:
+            stats.setdefault("abilities", []).extend(new_abilities)
+        current_form = evolved_form
 
-        # Add new abilities
-        for new_ability in evolution_data.get("abilities", []):
-            stats.setdefault("abilities", []).append(new_ability)
+    return stats
 
-        current_form = evolved_form
 
+def _copy_hero_stats(stats):
+    """Shallow-copy a stats dict; ability dicts are shared, only the list is fresh."""
+    stats = dict(stats)
+    if "abilities" in stats:
+        stats["abilities"] = list(stats["abilities"])
     return stats
 
 
@@ -377,14 +393,51 @@ def apply_hero_evolutions_to_stats(all_stats, hero_evolutions):
     if not hero_evolutions:
         return all_stats
 
-    result = deepcopy(all_stats)
+    # Only the evolved hero entries are replaced, and those are built fresh
+    result = dict(all_stats)
 
     for base_hero, evolution_path in hero_evolutions.items():
-        if base_hero not in result:
+        # Unknown heroes and empty paths keep their existing entry
+        if not evolution_path or base_hero not in all_stats:
             continue
 
         evolved_stats = get_evolved_hero_stats(base_hero, hero_evolutions, all_stats)
-        if evolved_stats:
+        if evolved_stats is not None:
             result[base_hero] = evolved_stats
 
     return result
+
+
+def _precompute_evolved_stats():
+    """Build stats for every (base_hero, path) reachable through HERO_EVOLUTIONS."""
+    table = {}
+    for base_hero, base_entry in HERO_STATS.items():
+        stack = [(base_hero, ())]
+        while stack:
+            form, path = stack.pop()
+            table[base_hero, path] = _apply_evolution_path(base_entry, base_hero, path)
+            for evolved_form in HERO_EVOLUTIONS.get(form, ()):
+                stack.append((evolved_form, (*path, evolved_form)))
+    return table
+
+
+def _compile_evolution_steps():
+    """Flatten HERO_EVOLUTIONS into (form, evolved_form) -> (deltas, abilities)."""
+    steps = {}
+    for form, form_evolutions in HERO_EVOLUTIONS.items():
+        for evolved_form, evolution_data in form_evolutions.items():
+            if not evolution_data:
+                continue
+            steps[form, evolved_form] = (
+                tuple((evolution_data.get("stat_changes") or {}).items()),
+                tuple(evolution_data.get("abilities") or ()),
+            )
+    return steps
+
+
+# One lookup per evolution step instead of walking the nested evolution dicts
+_EVOLUTION_STEPS = _compile_evolution_steps()
+
+# HERO_STATS and HERO_EVOLUTIONS are static, so every valid evolution path is
+# resolved once at import; unknown paths fall back to computing on the fly.
+_PRECOMPUTED_STATS = _precompute_evolved_stats()
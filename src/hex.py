@@ -1,8 +1,19 @@
 """Hex grid utilities (offset coordinates, even-r) and pathfinding."""
 
 from collections import deque
+from functools import lru_cache
+from itertools import chain
 
+# Neighbor offsets for even and odd rows (even-r layout)
+_EVEN_ROW_DIRS = ((1, 0), (-1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1))
+_ODD_ROW_DIRS = ((1, 0), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 1))
 
+
+# Boards are small (at most 17 x 15 cells), so these bounds hold every cell
+# and every cell pair of both boards; the limits keep off-board or otherwise
+# unexpected positions from growing the caches. Positions must be hashable
+# (col, row) tuples.
+@lru_cache(maxsize=1024)
 def offset_to_cube(col, row):
     x = col - (row - (row % 2)) // 2
     z = row
@@ -14,67 +25,149 @@ def cube_distance(a, b):
     return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
 
 
+@lru_cache(maxsize=1 << 17)
 def hex_distance(c1, c2):
     return cube_distance(offset_to_cube(*c1), offset_to_cube(*c2))
 
 
+def _compute_neighbors(col, row, cols, rows):
+    dirs = _ODD_ROW_DIRS if row % 2 else _EVEN_ROW_DIRS
+    return tuple(
+        (col + dc, row + dr)
+        for dc, dr in dirs
+        if 0 <= col + dc < cols and 0 <= row + dr < rows
+    )
+
+
+@lru_cache(maxsize=8)
+def build_neighbor_table(cols, rows):
+    """Return a dict mapping every (col, row) on the board to its in-bounds neighbors."""
+    return {
+        (c, r): _compute_neighbors(c, r, cols, rows)
+        for r in range(rows)
+        for c in range(cols)
+    }
+
+
+@lru_cache(maxsize=8)
+def build_neighbor_index_table(cols, rows):
+    """Return neighbors by cell index, for int-indexed searches.
+
+    Cells are numbered idx = row * cols + col; entry idx is a tuple of the
+    indices of that cell's in-bounds neighbors.
+    """
+    table = [()] * (cols * rows)
+    for (c, r), nbs in build_neighbor_table(cols, rows).items():
+        table[r * cols + c] = tuple(nr * cols + nc for nc, nr in nbs)
+    return tuple(table)
+
+
+@lru_cache(maxsize=4)
+def build_distance_table(cols, rows):
+    """Return hex distances between every pair of cells, by cell index.
+
+    Entry idx is a bytes row whose byte at another cell's index is the
+    distance between the two, so board-wide radius scans index instead of
+    calling hex_distance per cell.
+    """
+    cubes = [offset_to_cube(c, r) for r in range(rows) for c in range(cols)]
+    return tuple(bytes(cube_distance(a, b) for b in cubes) for a in cubes)
+
+
 def hex_neighbors(col, row, cols, rows):
-    parity = row % 2
-    if parity == 0:
-        dirs = [(1, 0), (-1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1)]
-    else:
-        dirs = [(1, 0), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 1)]
-    results = []
-    for dc, dr in dirs:
-        nc, nr = col + dc, row + dr
-        if 0 <= nc < cols and 0 <= nr < rows:
-            results.append((nc, nr))
-    return results
+    nbs = build_neighbor_table(cols, rows).get((col, row))
+    if nbs is None:
+        # Off-board start; compute directly rather than polluting the table
+        return _compute_neighbors(col, row, cols, rows)
+    return nbs
 
 
 # --- Pathfinding ---
 
 
+def _occupancy_bitmap(occupied, cols, rows):
+    """Return a bytearray with 1 at the cell index of every on-board occupied hex."""
+    bitmap = bytearray(cols * rows)
+    for c, r in occupied:
+        if 0 <= c < cols and 0 <= r < rows:
+            bitmap[r * cols + c] = 1
+    return bitmap
+
+
+def _as_set(occupied):
+    """Return occupied as a set, converting once so membership tests are O(1)."""
+    if isinstance(occupied, (set, frozenset)):
+        return occupied
+    return set(occupied)
+
+
 def bfs_next_step(start, goal, occupied, cols, rows):
     """Return the next hex to move to from start toward goal, avoiding occupied hexes.
     If no full path exists, moves to the unoccupied neighbor closest to goal by hex distance."""
     if start == goal:
         return start
 
-    def _neighbor_priority(current, nb):
-        current_dist = hex_distance(current, goal)
-        next_dist = hex_distance(nb, goal)
-        closer = 0 if next_dist < current_dist else 1
-        horizontal = 0 if nb[1] == current[1] else 1
-        return (closer, horizontal, next_dist)
+    neighbor_table = build_neighbor_table(cols, rows)
+    # Adjacent goal (the usual melee case): the search would step straight to it
+    if goal in neighbor_table[start]:
+        return goal
+
+    gx, _, gz = offset_to_cube(*goal)
 
-    start_dist = hex_distance(start, goal)
+    def _dist_to_goal(pos):
+        # hex_distance inlined against the precomputed goal cube
+        c, r = pos
+        dx = c - ((r - (r & 1)) >> 1) - gx
+        dz = r - gz
+        # Cube coordinates sum to zero, so dy follows from dx and dz
+        return max(abs(dx), abs(dx + dz), abs(dz))
+
+    occupied = _as_set(occupied)
+    # Occupied hexes are never entered, except the goal itself
+    blocked = occupied - {goal}
+    start_dist = _dist_to_goal(start)
     queue = deque()
-    queue.append((start, [start]))
-    visited = {start}
+    queue.append(start)
+    parents = {start: None}
     while queue:
-        current, path = queue.popleft()
-        neighbors = hex_neighbors(current[0], current[1], cols, rows)
-        neighbors.sort(key=lambda nb: _neighbor_priority(current, nb))
-        for nb in neighbors:
-            if nb in visited:
+        current = queue.popleft()
+        current_dist = _dist_to_goal(current)
+        row = current[1]
+        # Prefer neighbors that close distance, then horizontal moves, then
+        # nearest. Closing neighbors all sit at current_dist - 1, so only the
+        # rest need ordering by distance; bucketing keeps table order otherwise.
+        closer_horiz = []
+        closer_vert = []
+        farther = []
+        for nb in neighbor_table[current]:
+            if nb in parents or nb in blocked:
                 continue
+            d = _dist_to_goal(nb)
             # Every step must be strictly closer to the goal than the start
-            if hex_distance(nb, goal) >= start_dist:
+            if d >= start_dist:
                 continue
-            visited.add(nb)
-            new_path = path + [nb]
+            if d < current_dist:
+                (closer_horiz if nb[1] == row else closer_vert).append(nb)
+            else:
+                farther.append((0 if nb[1] == row else 1, d, nb))
+        if len(farther) > 1:
+            farther.sort(key=lambda entry: entry[:2])
+        for nb in chain(closer_horiz, closer_vert, [entry[2] for entry in farther]):
+            parents[nb] = current
             if nb == goal:
-                return new_path[1]
-            if nb not in occupied:
-                queue.append((nb, new_path))
+                # Walk back to the hex whose parent is start
+                step = nb
+                while parents[step] != start:
+                    step = parents[step]
+                return step
+            queue.append(nb)
     # No full path — move to the unoccupied neighbor closest to goal (but
     # never equal or farther than current distance; stay put if none closer)
     best = start
     best_dist = start_dist
-    for nb in hex_neighbors(start[0], start[1], cols, rows):
+    for nb in neighbor_table[start]:
         if nb not in occupied:
-            d = hex_distance(nb, goal)
+            d = _dist_to_goal(nb)
             if d < best_dist:
                 best_dist = d
                 best = nb
@@ -86,37 +179,95 @@ def bfs_path_length(start, goal, occupied, cols, rows):
     The goal itself is allowed even if occupied. Returns a large number if no path."""
     if start == goal:
         return 0
-    queue = deque()
-    queue.append((start, 0))
-    visited = {start}
-    while queue:
-        current, dist = queue.popleft()
-        for nb in hex_neighbors(current[0], current[1], cols, rows):
-            if nb in visited:
-                continue
-            visited.add(nb)
-            if nb == goal:
-                return dist + 1
-            if nb not in occupied:
-                queue.append((nb, dist + 1))
+    neighbor_table = build_neighbor_index_table(cols, rows)
+    blocked = _occupancy_bitmap(occupied, cols, rows)
+    start_idx = start[1] * cols + start[0]
+    goal_idx = goal[1] * cols + goal[0]
+    blocked[start_idx] = 0
+    blocked[goal_idx] = 0
+    # Search from both ends, growing the smaller frontier one whole level at a
+    # time; the searches meet after exploring far fewer hexes than one would.
+    fwd_dist = {start_idx: 0}
+    bwd_dist = {goal_idx: 0}
+    fwd_frontier = [start_idx]
+    bwd_frontier = [goal_idx]
+    while fwd_frontier and bwd_frontier:
+        forward = len(fwd_frontier) <= len(bwd_frontier)
+        if forward:
+            frontier, dist, other_dist = fwd_frontier, fwd_dist, bwd_dist
+        else:
+            frontier, dist, other_dist = bwd_frontier, bwd_dist, fwd_dist
+        best = 9999
+        next_frontier = []
+        for idx in frontier:
+            d = dist[idx] + 1
+            for nb in neighbor_table[idx]:
+                if blocked[nb] or nb in dist:
+                    continue
+                other = other_dist.get(nb)
+                if other is not None:
+                    # Meetings within one level can differ; keep the shortest
+                    best = min(best, d + other)
+                    continue
+                dist[nb] = d
+                next_frontier.append(nb)
+        if best < 9999:
+            return best
+        if forward:
+            fwd_frontier = next_frontier
+        else:
+            bwd_frontier = next_frontier
     return 9999
 
 
+def bfs_distance_field(start, cols, rows, occupied):
+    """Return BFS distances from start to every hex, indexed by row * cols + col.
+
+    Occupied hexes get a distance (like the goal of bfs_path_length, they may
+    end a path) but are never walked through; unreachable hexes are 9999. One
+    field answers bfs_path_length from start for any number of goals.
+    """
+    neighbor_table = build_neighbor_index_table(cols, rows)
+    blocked = _occupancy_bitmap(occupied, cols, rows)
+    dist = [9999] * (cols * rows)
+    start_idx = start[1] * cols + start[0]
+    dist[start_idx] = 0
+    frontier = [start_idx]
+    d = 0
+    while frontier:
+        d += 1
+        next_frontier = []
+        for idx in frontier:
+            for nb in neighbor_table[idx]:
+                if dist[nb] != 9999:
+                    continue
+                dist[nb] = d
+                if not blocked[nb]:
+                    next_frontier.append(nb)
+        frontier = next_frontier
+    return dist
+
+
 def reachable_hexes(start, steps, cols, rows, occupied):
     """Return set of hexes reachable from start within `steps` moves, avoiding occupied."""
-    visited = {start: 0}
-    queue = deque([(start, 0)])
-    while queue:
-        pos, dist = queue.popleft()
-        if dist >= steps:
-            continue
-        for nb in hex_neighbors(pos[0], pos[1], cols, rows):
-            if nb not in visited and nb not in occupied:
-                visited[nb] = dist + 1
-                queue.append((nb, dist + 1))
-    result = set(visited.keys())
-    result.discard(start)
-    return result
+    neighbor_table = build_neighbor_index_table(cols, rows)
+    seen = _occupancy_bitmap(occupied, cols, rows)
+    start_idx = start[1] * cols + start[0]
+    seen[start_idx] = 1
+    reached = []
+    frontier = [start_idx]
+    for _ in range(steps):
+        next_frontier = []
+        for idx in frontier:
+            for nb in neighbor_table[idx]:
+                if not seen[nb]:
+                    seen[nb] = 1
+                    next_frontier.append(nb)
+        if not next_frontier:
+            break
+        reached.extend(next_frontier)
+        frontier = next_frontier
+    return {(idx % cols, idx // cols) for idx in reached}
 
 
 def bfs_speed_move(start, goal, blocked, all_occupied, cols, rows):
@@ -126,47 +277,56 @@ def bfs_speed_move(start, goal, blocked, all_occupied, cols, rows):
     """
     if start == goal:
         return start, start
-    # BFS up to depth 2; track (pos, path) where path includes start
-    queue = deque([(start, [start])])
+    neighbor_table = build_neighbor_table(cols, rows)
+    # BFS up to depth 2, remembering for each hex the first step taken toward it
+    frontier = [(start, None)]
     visited = {start}
-    candidates = []  # (hex_distance_to_goal, path)
-    for _ in range(2):
-        next_queue = deque()
-        while queue:
-            pos, path = queue.popleft()
-            for nb in hex_neighbors(pos[0], pos[1], cols, rows):
+    candidates = []  # (hex_distance_to_goal, landing, first_step)
+    for depth in range(2):
+        next_frontier = []
+        for pos, first_step in frontier:
+            for nb in neighbor_table[pos]:
                 if nb in visited or nb in blocked:
                     continue
                 visited.add(nb)
-                new_path = path + [nb]
+                step = first_step or nb
                 # Can only land on empty hex (not occupied by anyone)
                 if nb not in all_occupied:
-                    candidates.append((hex_distance(nb, goal), new_path))
-                if len(new_path) - 1 < 2:  # can still expand
-                    next_queue.append((nb, new_path))
-        queue = next_queue
+                    candidates.append((hex_distance(nb, goal), nb, step))
+                if depth == 0:  # can still expand
+                    next_frontier.append((nb, step))
+        frontier = next_frontier
     if not candidates:
         return start, start
-    candidates.sort(key=lambda c: c[0])
-    best_path = candidates[0][1]
-    return best_path[-1], best_path[1]
+    _, landing, first_step = min(candidates, key=lambda c: c[0])
+    return landing, first_step
 
 
 def bfs_path(start, goal, cols, rows, occupied):
     """Return the path from start to goal avoiding occupied hexes, or None."""
     if start == goal:
         return [start]
-    queue = deque([(start, [start])])
-    visited = {start}
+    neighbor_table = build_neighbor_index_table(cols, rows)
+    blocked = _occupancy_bitmap(occupied, cols, rows)
+    start_idx = start[1] * cols + start[0]
+    goal_idx = goal[1] * cols + goal[0]
+    blocked[goal_idx] = 0
+    # parents[idx] is the index the search reached idx from; -1 means unseen
+    parents = [-1] * (cols * rows)
+    parents[start_idx] = start_idx
+    queue = deque([start_idx])
     while queue:
-        pos, path = queue.popleft()
-        for nb in hex_neighbors(pos[0], pos[1], cols, rows):
-            if nb in visited:
+        idx = queue.popleft()
+        for nb in neighbor_table[idx]:
+            if parents[nb] >= 0 or blocked[nb]:
                 continue
-            visited.add(nb)
-            new_path = path + [nb]
-            if nb == goal:
-                return new_path
-            if nb not in occupied:
-                queue.append((nb, new_path))
+            parents[nb] = idx
+            if nb == goal_idx:
+                path = [goal]
+                while nb != start_idx:
+                    nb = parents[nb]
+                    path.append((nb % cols, nb // cols))
+                path.reverse()
+                return path
+            queue.append(nb)
     return None
@@ -1,6 +1,5 @@
 """Launcher: Host & Play or Join dialog for multiplayer Wager of War."""
 
-import tkinter as tk
 import subprocess
 import sys
 import os
@@ -8,9 +7,23 @@ from .compat import setup_frozen_path
 
 setup_frozen_path()
 
+# Detach the server from the launcher's console/session and stdin, so closing
+# the launcher's terminal neither signals it nor leaves it waiting on input
+if sys.platform == "win32":
+    _POPEN_KW = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _POPEN_KW = {"start_new_session": True}
+
+# tkinter is imported when the first LauncherGUI is built, so importing this
+# module (tests, tooling) does not load Tcl/Tk
+tk = None
+
 
 class LauncherGUI:
     def __init__(self):
+        global tk
+        import tkinter as tk
+
         self.root = tk.Tk()
         self.root.title("Wager of War - Multiplayer Launcher")
         self.root.resizable(False, False)
@@ -196,12 +209,7 @@ class LauncherGUI:
             "--upgrade-mode",
             upgrade_mode,
         ]
-        self._server_proc = subprocess.Popen(
-            cmd,
-            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
-            if sys.platform == "win32"
-            else 0,
-        )
+        self._server_proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, **_POPEN_KW)
         self._server_frame.pack(fill=tk.X, pady=5)
         self._server_status_var.set(f"Server running (port {port})")
         self._server_indicator.config(fg="green")
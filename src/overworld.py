@@ -1,7 +1,11 @@
+import contextlib
+import itertools
 import os
 import random
-from dataclasses import dataclass
-from .hex import hex_distance
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import lru_cache
+from .hex import reachable_hexes
 from .protocol import (
     deserialize_armies,
     deserialize_bases,
@@ -175,7 +179,15 @@ UNIT_STATS = {
     },
 }
 
-ALL_UNIT_STATS = {**UNIT_STATS, **HERO_STATS}
+# A live view rather than a merged copy, so heroes and units stay the single
+# source of truth. Heroes come first so they win lookups and iteration still
+# lists units before heroes, exactly like {**UNIT_STATS, **HERO_STATS}.
+ALL_UNIT_STATS = ChainMap(HERO_STATS, UNIT_STATS)
+
+# Flat views of the static UNIT_STATS table for spawn/build paths, which
+# otherwise rebuild the name list and do two dict hops per unit value
+UNIT_NAMES = tuple(UNIT_STATS)
+UNIT_VALUES = {name: stats["value"] for name, stats in UNIT_STATS.items()}
 
 FACTIONS = {
     "Custodians": ["Page", "Librarian", "Steward", "Gatekeeper"],
@@ -185,24 +197,73 @@ FACTIONS = {
 }
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class OverworldArmy:
     player: int
-    units: list  # list of (unit_type, count) tuples
+    units_by_name: dict  # unit_type -> count, in the order types joined
     pos: tuple  # (col, row)
     exhausted: bool = False
     moniker: str | None = None  # Army codename (e.g., "Ironfall")
+    # Kept in step by the units setter and add_units, which are the only ways
+    # the counts change; drawing reads these for every army on every frame
+    total_count: int = field(default=0, repr=False, compare=False)
+    _label: str | None = field(default=None, repr=False, compare=False)
+
+    def __init__(self, player, units, pos, exhausted=False, moniker=None):
+        self.player = player
+        self.units = units
+        self.pos = pos
+        self.exhausted = exhausted
+        self.moniker = moniker
 
     @property
-    def label(self):
-        return " + ".join(f"{count} {name}" for name, count in self.units)
-
-    @property
-    def total_count(self):
-        return sum(count for _, count in self.units)
+    def units(self):
+        """List of (unit_type, count) tuples; a copy, so assign to change it."""
+        return list(self.units_by_name.items())
+
+    @units.setter
+    def units(self, units):
+        counts = {}
+        for name, count in units:
+            counts[name] = counts.get(name, 0) + count
+        self.units_by_name = counts
+        self.total_count = sum(counts.values())
+        self._label = None
 
+    def add_units(self, unit_name, count):
+        counts = self.units_by_name
+        counts[unit_name] = counts.get(unit_name, 0) + count
+        self.total_count += count
+        self._label = None
 
-@dataclass
+    @property
+    def label(self):
+        if self._label is None:
+            self._label = " + ".join(
+                f"{count} {name}" for name, count in self.units_by_name.items()
+            )
+        return self._label
+
+
+@lru_cache(maxsize=4)
+def _quadrant_cells(cols, rows):
+    """Return the cells of each board quadrant (top-left, top-right, bottom-left,
+    bottom-right), each in row-major order as (row * cols + col, (col, row))."""
+    mid_c = cols // 2
+    mid_r = rows // 2
+    quadrants = (
+        (range(mid_c), range(mid_r)),
+        (range(mid_c, cols), range(mid_r)),
+        (range(mid_c), range(mid_r, rows)),
+        (range(mid_c, cols), range(mid_r, rows)),
+    )
+    return tuple(
+        tuple((r * cols + c, (c, r)) for r in row_range for c in col_range)
+        for col_range, row_range in quadrants
+    )
+
+
+@dataclass(slots=True)
 class Structure:
     player: int
     pos: tuple  # (col, row)
@@ -215,22 +276,184 @@ class Structure:
 Base = Structure
 
 
-@dataclass
+@dataclass(slots=True)
 class GoldPile:
     pos: tuple  # (col, row)
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Objective:
     pos: tuple  # (col, row)
     faction: str
 
 
+# Shared so a revision number is never reused, even by a replacement list
+_list_revisions = itertools.count()
+
+
+class _PosIndexedList(list):
+    """A list of objects with a .pos that also indexes them by position.
+
+    Lookups by position are O(1) instead of a scan of the whole list. The index
+    follows every list mutation; bulk reorders or splices simply rebuild it.
+    Objects whose pos changes while in the list must be passed to reindex().
+    `revision` changes on every mutation, for caches derived from the list.
+    """
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self._rebuild()
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def _rebuild(self):
+        by_pos = {}
+        for item in self:
+            by_pos.setdefault(item.pos, []).append(item)
+        self._by_pos = by_pos
+        self.revision = next(_list_revisions)
+
+    def _unindex(self, item, pos):
+        """Drop item from the bucket at pos; return False if it was not there."""
+        bucket = self._by_pos.get(pos, ())
+        for i, other in enumerate(bucket):
+            if other is item:
+                del bucket[i]
+                if not bucket:
+                    del self._by_pos[pos]
+                return True
+        return False
+
+    def at(self, pos):
+        """Return the items at pos in list order (do not mutate the result)."""
+        return self._by_pos.get(pos, ())
+
+    def positions(self):
+        """Return a live view of every position holding at least one item."""
+        return self._by_pos.keys()
+
+    def reindex(self, item, old_pos):
+        """Move item's index entry from old_pos to its current pos."""
+        if not self._unindex(item, old_pos):
+            return
+        # Rebuild the destination bucket so it stays in list order and
+        # lookups keep returning the same first match as a list scan
+        pos = item.pos
+        self._by_pos[pos] = [other for other in self if other.pos == pos]
+
+    def append(self, item):
+        super().append(item)
+        self._by_pos.setdefault(item.pos, []).append(item)
+        self.revision = next(_list_revisions)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __contains__(self, item):
+        # Members are found by identity in their position bucket; only
+        # non-members pay for list.__contains__'s scan of dataclass __eq__
+        bucket = self._by_pos.get(getattr(item, "pos", None), ())
+        return any(other is item for other in bucket) or super().__contains__(item)
+
+    def remove(self, item):
+        # list.remove drops the first *equal* element, which may not be item,
+        # and calls dataclass __eq__ on every element before it; match by
+        # identity, falling back to equality for an item that is not a member
+        for i, other in enumerate(self):
+            if other is item:
+                break
+        else:
+            i = self.index(item)
+        removed = self[i]
+        super().__delitem__(i)
+        self._unindex(removed, removed.pos)
+        self.revision = next(_list_revisions)
+
+    def pop(self, i=-1):
+        item = super().pop(i)
+        self._unindex(item, item.pos)
+        self.revision = next(_list_revisions)
+        return item
+
+    def clear(self):
+        super().clear()
+        self._by_pos = {}
+        self.revision = next(_list_revisions)
+
+    def insert(self, i, item):
+        super().insert(i, item)
+        self._rebuild()
+
+    def __setitem__(self, i, value):
+        super().__setitem__(i, value)
+        self._rebuild()
+
+    def __delitem__(self, i):
+        super().__delitem__(i)
+        self._rebuild()
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._rebuild()
+        return self
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._rebuild()
+
+
+class _PosIndexed:
+    """Attribute that stores whatever list is assigned as a _PosIndexedList."""
+
+    def __set_name__(self, owner, name):
+        self.attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, items):
+        if not isinstance(items, _PosIndexedList):
+            items = _PosIndexedList(items)
+        setattr(obj, self.attr, items)
+
+
 class Overworld:
     COLS = 14
     ROWS = 14
 
+    # Fixed attribute set; the list attributes live in the slots behind their
+    # _PosIndexed descriptors
+    __slots__ = (
+        "_armies",
+        "_bases",
+        "_gold_piles",
+        "_moniker_pool",
+        "_objectives",
+        "_player_base_cache",
+        "gold",
+        "rng",
+        "rng_seed",
+    )
+
+    # Assigning a plain list (e.g. from deserialize_armies) wraps it
+    armies = _PosIndexed()
+    bases = _PosIndexed()
+    gold_piles = _PosIndexed()
+    objectives = _PosIndexed()
+
     def __init__(self, num_players=2, rng_seed=None):
         if rng_seed is None:
             rng_seed = random.SystemRandom().randint(0, 2**31 - 1)
@@ -239,12 +462,16 @@ class Overworld:
         self.armies = []
         self.gold = {p: STARTING_GOLD for p in range(1, num_players + 1)}
         self.bases = []
-        self._spawn_bases(num_players)
-        self._spawn_neutral_structures()
         self.gold_piles = []
-        self._spawn_gold_piles()
         self.objectives = []
-        self._spawn_objectives()
+        self._player_base_cache = None
+        # Cells claimed so far by structures and gold piles (their guards
+        # share those cells), indexed row * COLS + col, shared by every phase
+        taken = bytearray(self.COLS * self.ROWS)
+        self._spawn_bases(num_players, taken)
+        self._spawn_neutral_structures(taken)
+        self._spawn_gold_piles(taken)
+        self._spawn_objectives(taken)
         # Moniker pool for naming armies
         self._moniker_pool = list(DEFAULT_MONIKERS)
         self.rng.shuffle(self._moniker_pool)
@@ -260,45 +487,26 @@ class Overworld:
             self._refill_moniker_pool()
         return self._moniker_pool.pop()
 
-    def _spawn_bases(self, num_players):
-        mid_c = self.COLS // 2
-        mid_r = self.ROWS // 2
-        quadrants = {
-            1: (range(0, mid_c), range(0, mid_r)),  # top-left
-            2: (range(mid_c, self.COLS), range(0, mid_r)),  # top-right
-            3: (range(0, mid_c), range(mid_r, self.ROWS)),  # bottom-left
-            4: (range(mid_c, self.COLS), range(mid_r, self.ROWS)),  # bottom-right
-        }
-        occupied = set()
+    def _spawn_bases(self, num_players, taken):
+        quadrants = _quadrant_cells(self.COLS, self.ROWS)
         for p in range(1, num_players + 1):
-            cols, rows = quadrants.get(p, quadrants[1])
-            candidates = [(c, r) for r in rows for c in cols if (c, r) not in occupied]
+            # Player p starts in quadrant p; extra players share the first
+            cells = quadrants[p - 1] if p <= len(quadrants) else quadrants[0]
+            candidates = [pos for idx, pos in cells if not taken[idx]]
             if len(candidates) < 3:
                 break
             picks = self.rng.sample(candidates, 3)
             for pos in picks:
-                occupied.add(pos)
+                taken[pos[1] * self.COLS + pos[0]] = 1
                 self.bases.append(Base(player=p, pos=pos))
 
-    def _spawn_neutral_structures(self):
+    def _spawn_neutral_structures(self, taken):
         """Spawn 3 neutral income-only structures per quadrant, each guarded."""
-        excluded = {b.pos for b in self.bases if b.alive}
-        mid_c = self.COLS // 2
-        mid_r = self.ROWS // 2
-        quadrants = [
-            (range(0, mid_c), range(0, mid_r)),
-            (range(mid_c, self.COLS), range(0, mid_r)),
-            (range(0, mid_c), range(mid_r, self.ROWS)),
-            (range(mid_c, self.COLS), range(mid_r, self.ROWS)),
-        ]
-        for cols, rows in quadrants:
-            available = [(c, r) for r in rows for c in cols if (c, r) not in excluded]
-            for _ in range(3):
-                if not available:
-                    break
-                pos = self.rng.choice(available)
-                available.remove(pos)
-                excluded.add(pos)
+        for cells in _quadrant_cells(self.COLS, self.ROWS):
+            available = [pos for idx, pos in cells if not taken[idx]]
+            picks = self.rng.sample(available, min(3, len(available)))
+            for pos in picks:
+                taken[pos[1] * self.COLS + pos[0]] = 1
                 income = self.rng.randint(5, 10)
                 self.bases.append(
                     Structure(
@@ -309,65 +517,43 @@ class Overworld:
                     )
                 )
                 # Spawn guards worth 6x the income value
-                guard_value = 6 * income
-                name = self.rng.choice(list(UNIT_STATS.keys()))
-                value = UNIT_STATS[name]["value"]
-                guard_count = max(1, round(guard_value / value))
-                self.armies.append(
-                    OverworldArmy(
-                        player=NEUTRAL_PLAYER, units=[(name, guard_count)], pos=pos
-                    )
-                )
+                self._spawn_guard(pos, 6 * income)
 
-    def _spawn_gold_piles(self, count=GOLD_PILE_COUNT):
-        excluded = {b.pos for b in self.bases if b.alive}
-        mid_c = self.COLS // 2
-        mid_r = self.ROWS // 2
-        quadrants = [
-            (range(0, mid_c), range(0, mid_r)),
-            (range(mid_c, self.COLS), range(0, mid_r)),
-            (range(0, mid_c), range(mid_r, self.ROWS)),
-            (range(mid_c, self.COLS), range(mid_r, self.ROWS)),
-        ]
+    def _spawn_gold_piles(self, taken, count=GOLD_PILE_COUNT):
         per_quad = max(1, count // 4)
-        for cols, rows in quadrants:
-            available = [(c, r) for r in rows for c in cols if (c, r) not in excluded]
-            for _ in range(per_quad):
-                if not available:
-                    break
-                pos = self.rng.choice(available)
-                available.remove(pos)
-                excluded.add(pos)
+        for cells in _quadrant_cells(self.COLS, self.ROWS):
+            available = [pos for idx, pos in cells if not taken[idx]]
+            picks = self.rng.sample(available, min(per_quad, len(available)))
+            for pos in picks:
+                taken[pos[1] * self.COLS + pos[0]] = 1
                 pile = GoldPile(
                     pos=pos,
                     value=self.rng.randint(GOLD_PILE_MIN, GOLD_PILE_MAX),
                 )
                 self.gold_piles.append(pile)
-                name = self.rng.choice(list(UNIT_STATS.keys()))
-                value = UNIT_STATS[name]["value"]
-                guard_count = max(1, round(2 * pile.value / value))
-                self.armies.append(
-                    OverworldArmy(
-                        player=NEUTRAL_PLAYER, units=[(name, guard_count)], pos=pile.pos
-                    )
-                )
-
-    def _spawn_objectives(self):
-        excluded = {b.pos for b in self.bases if b.alive}
-        excluded |= {p.pos for p in self.gold_piles}
-        excluded |= {a.pos for a in self.armies}
-        available = [
-            (c, r)
-            for r in range(self.ROWS)
-            for c in range(self.COLS)
-            if (c, r) not in excluded
-        ]
-
+                self._spawn_guard(pos, 2 * pile.value)
+
+    def _spawn_guard(self, pos, guard_value):
+        """Spawn a neutral army of one random unit type worth about guard_value."""
+        name = self.rng.choice(UNIT_NAMES)
+        guard_count = max(1, round(guard_value / UNIT_VALUES[name]))
+        self.armies.append(
+            OverworldArmy(player=NEUTRAL_PLAYER, units=[(name, guard_count)], pos=pos)
+        )
+
+    def _spawn_objectives(self, taken):
+        cols = self.COLS
         faction_list = list(FACTIONS.keys())
         faction_slots = {faction: idx + 1 for idx, faction in enumerate(faction_list)}
         base_by_player = {
             p: [b.pos for b in self.bases if b.player == p] for p in range(1, 5)
         }
+        # Bases don't move while objectives spawn, so each slot's nearby cells
+        # are found once, in row-major order like a scan of the whole board
+        near_by_player = {
+            p: sorted(r * cols + c for c, r in self._hexes_near(positions))
+            for p, positions in base_by_player.items()
+        }
 
         for faction_name in faction_list:
             home_slot = faction_slots.get(faction_name)
@@ -375,7 +561,7 @@ class Overworld:
                 if enemy_slot == home_slot:
                     continue
                 pos = self._pick_objective_pos_near(
-                    base_by_player.get(enemy_slot, []), available
+                    near_by_player.get(enemy_slot, ()), taken
                 )
                 if pos is None:
                     return
@@ -383,43 +569,43 @@ class Overworld:
                 self._spawn_objective_guards(pos)
 
     def _spawn_objective_guards(self, pos):
-        unit_names = list(UNIT_STATS.keys())
-        if len(unit_names) < 2:
+        if len(UNIT_NAMES) < 2:
             return
-        choices = self.rng.sample(unit_names, 2)
+        choices = self.rng.sample(UNIT_NAMES, 2)
         units = []
         for name in choices:
-            value = UNIT_STATS[name]["value"]
+            value = UNIT_VALUES[name]
             count = max(1, round(OBJECTIVE_GUARD_VALUE / value))
             units.append((name, count))
         self.armies.append(OverworldArmy(player=NEUTRAL_PLAYER, units=units, pos=pos))
 
-    def _pick_objective_pos_near(self, base_positions, available):
-        if not available:
-            return None
-        candidates = []
-        for pos in available:
-            if any(
-                hex_distance(pos, bpos) <= OBJECTIVE_NEAR_DISTANCE
-                for bpos in base_positions
-            ):
-                candidates.append(pos)
-        pool = candidates or list(available)
-        pos = self.rng.choice(pool)
-        available.remove(pos)
-        return pos
+    def _hexes_near(self, positions):
+        """Return every hex within OBJECTIVE_NEAR_DISTANCE of any of positions."""
+        near = set(positions)
+        for pos in positions:
+            near |= reachable_hexes(
+                pos, OBJECTIVE_NEAR_DISTANCE, self.COLS, self.ROWS, ()
+            )
+        return near
+
+    def _pick_objective_pos_near(self, near, taken):
+        """Claim a free cell from near (cell indices), else any free cell."""
+        candidates = [idx for idx in near if not taken[idx]]
+        if not candidates:
+            candidates = [idx for idx in range(len(taken)) if not taken[idx]]
+            if not candidates:
+                return None
+        idx = self.rng.choice(candidates)
+        taken[idx] = 1
+        return (idx % self.COLS, idx // self.COLS)
 
     def get_gold_pile_at(self, pos):
-        for pile in self.gold_piles:
-            if pile.pos == pos:
-                return pile
-        return None
+        piles = self.gold_piles.at(pos)
+        return piles[0] if piles else None
 
     def get_objective_at(self, pos):
-        for objective in getattr(self, "objectives", []):
-            if objective.pos == pos:
-                return objective
-        return None
+        objectives = self.objectives.at(pos)
+        return objectives[0] if objectives else None
 
     def collect_gold_at(self, pos, player):
         pile = self.get_gold_pile_at(pos)
@@ -430,41 +616,63 @@ class Overworld:
         self.gold_piles.remove(pile)
         return value
 
+    def bases_changed(self):
+        """Note that a base's owner, status or income was changed in place.
+
+        Callers that capture, destroy or re-rate a base call this so the
+        per-player base index is rebuilt on its next use.
+        """
+        self._player_base_cache = None
+
+    def _player_base_index(self):
+        """Return ({player: alive bases in list order}, {player: total income}).
+
+        Rebuilt in one pass only after the base list changed or bases_changed()
+        was called since the last call.
+        """
+        bases = self.bases
+        stamp = bases.revision
+        cached = self._player_base_cache
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        by_player = {}
+        income = {}
+        for b in bases:
+            if b.alive:
+                by_player.setdefault(b.player, []).append(b)
+                income[b.player] = income.get(b.player, 0) + b.income
+        self._player_base_cache = (stamp, by_player, income)
+        return by_player, income
+
     def grant_income(self, player):
-        income = sum(b.income for b in self.bases if b.alive and b.player == player)
+        income = self._player_base_index()[1].get(player, 0)
         if income:
             self.gold[player] = self.gold.get(player, 0) + income
         return income
 
     def get_base_at(self, pos):
-        for b in self.bases:
-            if b.pos == pos and b.alive:
+        for b in self.bases.at(pos):
+            if b.alive:
                 return b
         return None
 
     def get_player_base(self, player):
-        for b in self.bases:
-            if b.player == player and b.alive:
-                return b
-        return None
+        bases = self._player_base_index()[0].get(player)
+        return bases[0] if bases else None
 
     def get_player_bases(self, player):
-        return [b for b in self.bases if b.player == player and b.alive]
+        return list(self._player_base_index()[0].get(player, ()))
 
     def _add_units_to_army(self, pos, player, unit_name, count):
         """Add units to an existing army at pos, or create a new one."""
         # Find the player's army at the position (not just any army)
         army = None
-        for a in self.armies:
-            if a.pos == pos and a.player == player:
+        for a in self.armies.at(pos):
+            if a.player == player:
                 army = a
                 break
         if army:
-            for i, (name, existing) in enumerate(army.units):
-                if name == unit_name:
-                    army.units[i] = (name, existing + count)
-                    return
-            army.units.append((unit_name, count))
+            army.add_units(unit_name, count)
         else:
             # Assign moniker to non-neutral armies
             moniker = self.get_moniker() if player != NEUTRAL_PLAYER else None
@@ -481,8 +689,8 @@ class Overworld:
         """Build a unit at the player's base. Returns error string or None on success."""
         # Find a base that allows recruitment
         base = None
-        for b in self.bases:
-            if b.player == player and b.alive and b.allows_recruitment:
+        for b in self._player_base_index()[0].get(player, ()):
+            if b.allows_recruitment:
                 base = b
                 break
         if not base:
@@ -491,18 +699,19 @@ class Overworld:
 
     def build_unit_at_pos(self, player, unit_name, pos):
         """Build a unit at a specific base position. Returns error string or None on success."""
-        if unit_name not in UNIT_STATS:
+        cost = UNIT_VALUES.get(unit_name)
+        if cost is None:
             return f"Unknown unit: {unit_name}"
         base = self.get_base_at(pos)
         if not base or base.player != player:
             return "Invalid base"
         if not base.allows_recruitment:
             return "This structure does not allow recruitment"
-        cost = UNIT_STATS[unit_name]["value"]
-        if self.gold.get(player, 0) < cost:
+        gold = self.gold.get(player, 0)
+        if gold < cost:
             return "Not enough gold"
-        self.gold[player] -= cost
-        self._add_units_to_army(base.pos, player, unit_name, 1)
+        self.gold[player] = gold - cost
+        self._add_units_to_army(pos, player, unit_name, 1)
         return None
 
     def add_unit_at_base(self, player, unit_name, count=1):
@@ -529,7 +738,7 @@ class Overworld:
             "gold": self.gold,
             "bases": serialize_bases(self.bases),
             "gold_piles": serialize_gold_piles(self.gold_piles),
-            "objectives": serialize_objectives(getattr(self, "objectives", [])),
+            "objectives": serialize_objectives(self.objectives),
         }
 
     @classmethod
@@ -543,16 +752,15 @@ class Overworld:
         ow.bases = deserialize_bases(data.get("bases", []))
         ow.gold_piles = deserialize_gold_piles(data.get("gold_piles", []))
         ow.objectives = deserialize_objectives(data.get("objectives", []))
+        ow._player_base_cache = None
         return ow
 
     def get_army_at(self, pos):
-        for a in self.armies:
-            if a.pos == pos:
-                return a
-        return None
+        armies = self.armies.at(pos)
+        return armies[0] if armies else None
 
     def get_armies_at(self, pos):
-        return [a for a in self.armies if a.pos == pos]
+        return list(self.armies.at(pos))
 
     def get_army_by_moniker(self, moniker):
         """Find an army by its moniker."""
@@ -564,14 +772,16 @@ class Overworld:
         return None
 
     def move_army(self, army, new_pos):
+        old_pos = army.pos
         army.pos = new_pos
+        if old_pos != new_pos:
+            self.armies.reindex(army, old_pos)
 
     def merge_armies(self, target, source):
         if target is source:
             return
-        counts = {name: count for name, count in target.units}
-        for name, count in source.units:
-            counts[name] = counts.get(name, 0) + count
-        target.units = list(counts.items())
-        if source in self.armies:
+        for name, count in source.units_by_name.items():
+            target.add_units(name, count)
+        # One scan of the list instead of a membership test and then remove
+        with contextlib.suppress(ValueError):
             self.armies.remove(source)
@@ -2,6 +2,7 @@ import tkinter as tk
 import math
 import os
 import random
+from functools import cache
 from PIL import Image, ImageTk
 from .battle_resolution import make_battle_units, resolve_battle
 from .combat import Battle
@@ -19,9 +20,14 @@ from .constants import (
     PLAYER_COLORS,
     PLAYER_COLORS_EXHAUSTED,
 )
-from .game_state import get_effective_unit_stats, is_hidden_objective_guard
-from .heroes import HEROES_BY_FACTION, get_heroes_for_faction
-from .hex import hex_neighbors, reachable_hexes
+from .game_state import (
+    auto_build_evenly,
+    blocked_positions,
+    get_effective_unit_stats,
+    is_hidden_objective_guard,
+)
+from .heroes import HEROES_BY_FACTION, get_hero_display_name, get_heroes_for_faction
+from .hex import hex_distance, hex_neighbors, reachable_hexes
 from .overworld import (
     Overworld,
     OverworldArmy,
@@ -66,8 +72,15 @@ from .quests import (
     check_quest_completable,
     get_unlockable_quests,
 )
+from .quest_effects import apply_decision_effects
 from .ai import AIController
 
+# Corner offsets of a drawn hex per unit of HEX_SIZE, pointy-top, inset to 85%
+_HEX_CORNERS = tuple(
+    (0.85 * math.cos(angle), 0.85 * math.sin(angle))
+    for angle in (math.radians(60 * i + 30) for i in range(6))
+)
+
 
 def unit_count(name):
     return ARMY_BUDGET // UNIT_STATS[name]["value"]
@@ -81,6 +94,24 @@ def _ability_descriptions(stats):
     return [describe_ability(ab) for ab in stats.get("abilities", [])]
 
 
+@cache
+def _roster_line(name):
+    """Return (description, ability hover text) for a base unit or hero.
+
+    The faction pickers list the static base tables, so each line is only
+    formatted once; units show their cost, heroes do not.
+    """
+    s = ALL_UNIT_STATS[name]
+    desc = f"  {name} — HP:{s['max_hp']} Dmg:{s['damage']} Rng:{s['range']}"
+    if name in UNIT_STATS:
+        desc += f" Cost:{s['value']}"
+    if s.get("speed", 1.0) > 1.0:
+        desc += f" Spd:{s['speed']}"
+    for ab_text in _ability_texts(s):
+        desc += f" {ab_text}"
+    return desc, "\n".join(_ability_descriptions(s))
+
+
 def _unit_tooltip_text(name, stats):
     armor = stats.get("armor", 0)
     stats_line = (
@@ -199,6 +230,8 @@ class OverworldGUI:
         self.player_economy = {}  # {player_id: {"income_bonus": int}}
         self.player_combat_rules = {}  # {player_id: {"revive_on_win": bool, ...}}
         self._effective_stats_cache = {}
+        self._reach_cache = None  # ((start, occupied), reachable) of last query
+        self._draw_scheduled = False
         self.ai_factions = {}
         self.ai_upgrades = {}
         self.ai_heroes = {}
@@ -268,12 +301,16 @@ class OverworldGUI:
             left_frame, width=canvas_w, height=canvas_h, bg="#2b3b2b"
         )
         self.canvas.pack(padx=5, pady=5)
+        # Board hex polygons outlive redraws: {(col, row): (item id, style)},
+        # laid out for _tile_origin = (hex size, x offset, y offset)
+        self._tile_items = {}
+        self._tile_origin = None
         self.canvas.bind("<Button-1>", self._on_click)
         self.canvas.bind("<Button-3>", self._on_right_click)
         self.canvas.bind("<Button-2>", self._on_pan_start)
         self.canvas.bind("<B2-Motion>", self._on_pan_move)
         self.canvas.bind("<ButtonRelease-2>", self._on_pan_end)
-        self.canvas.bind("<Motion>", self._on_hover)
+        self.canvas.bind("<Motion>", self._request_hover)
         # Scroll wheel zoom (Windows uses MouseWheel, Linux uses Button-4/5)
         self.canvas.bind("<MouseWheel>", self._on_scroll_zoom)
         self.canvas.bind("<Button-4>", self._on_scroll_zoom)
@@ -364,10 +401,13 @@ class OverworldGUI:
         self._local_battle_history = {}
         self._next_local_battle_id = 1
 
-        self.tooltip = None
+        self.tooltip = None  # the map hover tooltip while it is shown
+        self._hover_tip = None  # (Toplevel, Label), reused for every hover
         self._hovered_army = None
+        self._pending_hover = None  # latest <Motion> event awaiting _flush_hover
         self._reward_tooltip = None
         self.combat_frame = None
+        self._combat_gui = None  # CombatGUI of the local battle in progress
         self.selected_structure = None
 
         if self._multiplayer:
@@ -455,8 +495,6 @@ class OverworldGUI:
 
     def _pick_faction(self):
         """Show a modal dialog for the player to pick a faction."""
-        import random as rng
-
         dialog = tk.Toplevel(self.root)
         dialog.title("Choose Your Faction")
         dialog.transient(self.root)
@@ -474,37 +512,25 @@ class OverworldGUI:
                 anchor="w"
             )
             for uname in unit_names:
-                s = UNIT_STATS[uname]
-                desc = f"  {uname} — HP:{s['max_hp']} Dmg:{s['damage']} Rng:{s['range']} Cost:{s['value']}"
-                if s.get("speed", 1.0) > 1.0:
-                    desc += f" Spd:{s['speed']}"
-                for ab_text in _ability_texts(s):
-                    desc += f" {ab_text}"
+                desc, hover_text = _roster_line(uname)
                 label = tk.Label(frame, text=desc, font=("Arial", 9), anchor="w")
                 label.pack(anchor="w")
-                ability_lines = _ability_descriptions(s)
-                if ability_lines:
-                    self._bind_ability_hover(label, "\n".join(ability_lines))
-            hero_names = HEROES_BY_FACTION.get(faction_name, [])
+                if hover_text:
+                    self._bind_ability_hover(label, hover_text)
+            hero_names = HEROES_BY_FACTION.get(faction_name, ())
             if hero_names:
                 tk.Label(frame, text="Heroes:", font=("Arial", 10, "bold")).pack(
                     anchor="w"
                 )
                 for hname in hero_names:
-                    hs = ALL_UNIT_STATS.get(hname)
-                    if hs:
-                        hdesc = f"  {hname} — HP:{hs['max_hp']} Dmg:{hs['damage']} Rng:{hs['range']}"
-                        if hs.get("speed", 1.0) > 1.0:
-                            hdesc += f" Spd:{hs['speed']}"
-                        for ab_text in _ability_texts(hs):
-                            hdesc += f" {ab_text}"
+                    if hname in ALL_UNIT_STATS:
+                        hdesc, hover_text = _roster_line(hname)
                         hlabel = tk.Label(
                             frame, text=hdesc, font=("Arial", 9), anchor="w"
                         )
                         hlabel.pack(anchor="w")
-                        ability_lines = _ability_descriptions(hs)
-                        if ability_lines:
-                            self._bind_ability_hover(hlabel, "\n".join(ability_lines))
+                        if hover_text:
+                            self._bind_ability_hover(hlabel, hover_text)
             tk.Button(
                 frame,
                 text=f"Play {faction_name}",
@@ -524,7 +550,7 @@ class OverworldGUI:
 
         # Default if somehow closed without picking
         if self.faction is None:
-            self.faction = rng.choice(list(FACTIONS.keys()))
+            self.faction = random.choice(list(FACTIONS.keys()))
 
     def _select_faction(self, faction_name, dialog):
         self.faction = faction_name
@@ -564,12 +590,10 @@ class OverworldGUI:
 
     def _auto_pick_upgrade(self, faction_name):
         """Pick a random upgrade for an AI faction."""
-        import random as rng
-
         upgrades = get_upgrades_for_faction(faction_name)
         if not upgrades:
             return None
-        return rng.choice(upgrades)["id"]
+        return random.choice(upgrades)["id"]
 
     def _get_effective_unit_stats(self, player_id):
         """Return a unit stats dict with the player's upgrades and evolutions applied."""
@@ -639,9 +663,10 @@ class OverworldGUI:
         if not upgrades:
             on_select(None, None)
             return
-        faction_units = FACTIONS.get(
-            faction_name, list(UNIT_STATS.keys())
-        ) + HEROES_BY_FACTION.get(faction_name, [])
+        faction_units = [
+            *FACTIONS.get(faction_name, UNIT_STATS.keys()),
+            *HEROES_BY_FACTION.get(faction_name, ()),
+        ]
         dialog = tk.Toplevel(self.root)
         dialog.title("Choose Your Upgrade")
         dialog.transient(self.root)
@@ -775,12 +800,7 @@ class OverworldGUI:
                 fg="gray" if is_taken else "black",
             ).pack(anchor="w")
             for uname in unit_names:
-                s = UNIT_STATS[uname]
-                desc = f"  {uname} — HP:{s['max_hp']} Dmg:{s['damage']} Rng:{s['range']} Cost:{s['value']}"
-                if s.get("speed", 1.0) > 1.0:
-                    desc += f" Spd:{s['speed']}"
-                for ab_text in _ability_texts(s):
-                    desc += f" {ab_text}"
+                desc, hover_text = _roster_line(uname)
                 label = tk.Label(
                     frame,
                     text=desc,
@@ -789,10 +809,9 @@ class OverworldGUI:
                     fg="gray" if is_taken else "black",
                 )
                 label.pack(anchor="w")
-                ability_lines = _ability_descriptions(s)
-                if ability_lines:
-                    self._bind_ability_hover(label, "\n".join(ability_lines))
-            hero_names = HEROES_BY_FACTION.get(faction_name, [])
+                if hover_text:
+                    self._bind_ability_hover(label, hover_text)
+            hero_names = HEROES_BY_FACTION.get(faction_name, ())
             if hero_names:
                 tk.Label(
                     frame,
@@ -801,13 +820,8 @@ class OverworldGUI:
                     fg="gray" if is_taken else "black",
                 ).pack(anchor="w")
                 for hname in hero_names:
-                    hs = ALL_UNIT_STATS.get(hname)
-                    if hs:
-                        hdesc = f"  {hname} — HP:{hs['max_hp']} Dmg:{hs['damage']} Rng:{hs['range']}"
-                        if hs.get("speed", 1.0) > 1.0:
-                            hdesc += f" Spd:{hs['speed']}"
-                        for ab_text in _ability_texts(hs):
-                            hdesc += f" {ab_text}"
+                    if hname in ALL_UNIT_STATS:
+                        hdesc, hover_text = _roster_line(hname)
                         hlabel = tk.Label(
                             frame,
                             text=hdesc,
@@ -816,9 +830,8 @@ class OverworldGUI:
                             fg="gray" if is_taken else "black",
                         )
                         hlabel.pack(anchor="w")
-                        hability_lines = _ability_descriptions(hs)
-                        if hability_lines:
-                            self._bind_ability_hover(hlabel, "\n".join(hability_lines))
+                        if hover_text:
+                            self._bind_ability_hover(hlabel, hover_text)
             btn = tk.Button(
                 frame,
                 text=f"Play {faction_name}",
@@ -871,9 +884,10 @@ class OverworldGUI:
                 command=lambda uid=upgrade_id: (on_select(uid), dialog.destroy()),
             )
             btn.pack(pady=2)
-            faction_units = FACTIONS.get(
-                faction_name, list(UNIT_STATS.keys())
-            ) + HEROES_BY_FACTION.get(faction_name, [])
+            faction_units = [
+                *FACTIONS.get(faction_name, UNIT_STATS.keys()),
+                *HEROES_BY_FACTION.get(faction_name, ()),
+            ]
             summaries = upgrade_effect_summaries(upgrade, ALL_UNIT_STATS, faction_units)
             keywords = upgrade_effect_keywords(upgrade, ALL_UNIT_STATS, faction_units)
             if summaries:
@@ -889,31 +903,7 @@ class OverworldGUI:
     def _auto_build_ai(self, player_id, faction_name):
         """Auto-spend an AI player's gold to create armies in single-player mode.
         Distributes gold roughly equally across all faction unit types."""
-        import random as rng
-
-        names = FACTIONS[faction_name]
-        spent = {n: 0 for n in names}
-        bases = self.world.get_player_bases(player_id)
-        base_spent = {b.pos: 0 for b in bases}
-        while self.world.gold.get(player_id, 0) > 0:
-            affordable = [
-                n for n in names if UNIT_STATS[n]["value"] <= self.world.gold[player_id]
-            ]
-            if not affordable:
-                break
-            # Pick the affordable unit with the least gold spent so far
-            min_spent = min(spent[n] for n in affordable)
-            candidates = [n for n in affordable if spent[n] == min_spent]
-            name = rng.choice(candidates)
-            spent[name] += UNIT_STATS[name]["value"]
-            if bases:
-                pos = min(base_spent, key=base_spent.get)
-                err = self.world.build_unit_at_pos(player_id, name, pos)
-                if err:
-                    break
-                base_spent[pos] += UNIT_STATS[name]["value"]
-            else:
-                self.world.build_unit(player_id, name)
+        auto_build_evenly(self.world, player_id, FACTIONS[faction_name])
 
     def _update_gold_display(self):
         my_player = self.player_id if self._multiplayer else 1
@@ -1269,22 +1259,91 @@ class OverworldGUI:
                 self._draw()
 
     def _hex_center(self, col, row):
-        x = self.HEX_SIZE * 1.75 * col + 50 + self.view_offset[0]
+        # Centers move with zoom and pan, so they are computed, not tabled
+        size = self.HEX_SIZE
+        x = size * 1.75 * col + 50 + self.view_offset[0]
         if row % 2 == 1:
-            x += self.HEX_SIZE * 0.875
-        y = self.HEX_SIZE * 1.5 * row + 50 + self.view_offset[1]
+            x += size * 0.875
+        y = size * 1.5 * row + 50 + self.view_offset[1]
         return x, y
 
     def _hex_polygon(self, cx, cy):
+        size = self.HEX_SIZE
         points = []
-        for i in range(6):
-            angle = math.radians(60 * i + 30)
-            points.append(cx + self.HEX_SIZE * 0.85 * math.cos(angle))
-            points.append(cy + self.HEX_SIZE * 0.85 * math.sin(angle))
+        for dx, dy in _HEX_CORNERS:
+            points.append(cx + size * dx)
+            points.append(cy + size * dy)
         return points
 
+    def _reachable_from(self, start, occupied):
+        """Return a fresh set of hexes an army at start can move to.
+
+        Hover and pan redraw with the same selection and armies over and over,
+        so the last answer is kept and reused while its inputs are unchanged.
+        """
+        key = (start, frozenset(occupied))
+        if self._reach_cache is None or self._reach_cache[0] != key:
+            reachable = reachable_hexes(
+                start, ARMY_MOVE_RANGE, self.world.COLS, self.world.ROWS, occupied
+            )
+            self._reach_cache = (key, reachable)
+        return set(self._reach_cache[1])
+
+    def _draw_tiles(self, neighbors):
+        """Restyle the persistent board hexes, moving them on pan and
+        rebuilding them only when the zoom changes."""
+        size = self.HEX_SIZE
+        ox, oy = self.view_offset
+        origin = self._tile_origin
+        if origin is None or origin[0] != size:
+            self.canvas.delete("tile")
+            self._tile_items = {}
+            for r in range(self.world.ROWS):
+                for c in range(self.world.COLS):
+                    cx, cy = self._hex_center(c, r)
+                    item = self.canvas.create_polygon(
+                        self._hex_polygon(cx, cy), tags="tile"
+                    )
+                    self._tile_items[c, r] = (item, None)
+            self.canvas.tag_lower("tile")
+        elif (ox, oy) != origin[1:]:
+            self.canvas.move("tile", ox - origin[1], oy - origin[2])
+        self._tile_origin = (size, ox, oy)
+
+        selected_pos = self.selected_army.pos if self.selected_army else None
+        tile_items = self._tile_items
+        for pos, (item, style) in tile_items.items():
+            fill = "#4a5a3a"
+            outline = "#666"
+            outline_width = 1
+            if pos in neighbors:
+                fill = "#5a6a4a"
+            if pos == selected_pos:
+                outline = "#ffff00"
+                outline_width = 3
+            new_style = (fill, outline, outline_width)
+            if new_style != style:
+                self.canvas.itemconfigure(
+                    item, fill=fill, outline=outline, width=outline_width
+                )
+                tile_items[pos] = (item, new_style)
+
+    def _request_draw(self):
+        """Schedule a redraw for the next idle turn, coalescing repeated requests."""
+        if self._draw_scheduled:
+            return
+        self._draw_scheduled = True
+        self.root.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        self._draw_scheduled = False
+        if not self.canvas.winfo_exists():
+            return  # map view was torn down before the idle callback ran
+        self._draw()
+
     def _draw(self):
-        self.canvas.delete("all")
+        # Everything but the board hexes is redrawn from scratch
+        self.canvas.delete("!tile")
         w = self.world
 
         # Determine reachable hexes for selected army
@@ -1298,16 +1357,12 @@ class OverworldGUI:
         my_faction = (
             self.player_factions.get(my_player) if self._multiplayer else self.faction
         )
+        my_color = PLAYER_COLORS.get(my_player, "#ffffff")
         if show_reachable:
-            occupied = {
-                a.pos
-                for a in w.armies
-                if a is not self.selected_army
-                and not self._is_hidden_objective_guard(a, my_faction)
-            }
-            neighbors = reachable_hexes(
-                self.selected_army.pos, ARMY_MOVE_RANGE, w.COLS, w.ROWS, occupied
+            occupied = blocked_positions(
+                w, self.selected_army, my_faction, w.get_objective_at
             )
+            neighbors = self._reachable_from(self.selected_army.pos, occupied)
             # Also include hexes occupied by enemy armies (attack targets)
             for a in w.armies:
                 if (
@@ -1316,23 +1371,7 @@ class OverworldGUI:
                 ):
                     neighbors.add(a.pos)
 
-        for r in range(w.ROWS):
-            for c in range(w.COLS):
-                cx, cy = self._hex_center(c, r)
-                fill = "#4a5a3a"
-                outline = "#666"
-                outline_width = 1
-                if (c, r) in neighbors:
-                    fill = "#5a6a4a"
-                if self.selected_army and (c, r) == self.selected_army.pos:
-                    outline = "#ffff00"
-                    outline_width = 3
-                self.canvas.create_polygon(
-                    self._hex_polygon(cx, cy),
-                    fill=fill,
-                    outline=outline,
-                    width=outline_width,
-                )
+        self._draw_tiles(neighbors)
 
         # Draw highlighted hex
         if self._highlighted_hex:
@@ -1345,9 +1384,9 @@ class OverworldGUI:
             )
 
         # Draw structures (behind armies)
-        army_positions = {a.pos for a in w.armies}
+        army_positions = w.armies.positions()
         sprites = self._get_scaled_sprites()
-        for base in getattr(w, "bases", []):
+        for base in w.bases:
             if not base.alive:
                 continue
             cx, cy = self._hex_center(base.pos[0], base.pos[1])
@@ -1397,7 +1436,7 @@ class OverworldGUI:
                         self.canvas.create_image(cx, cy, image=sprite)
 
         # Draw gold piles
-        for pile in getattr(w, "gold_piles", []):
+        for pile in w.gold_piles:
             cx, cy = self._hex_center(pile.pos[0], pile.pos[1])
             if pile.pos in army_positions:
                 # Show small gold icon at top-right of hex when army is on top
@@ -1409,11 +1448,11 @@ class OverworldGUI:
                 self.canvas.create_image(cx, cy, image=sprites["gold"])
 
         # Draw objectives (only visible to owning faction)
-        for obj in getattr(w, "objectives", []):
+        for obj in w.objectives:
             if obj.faction != my_faction:
                 continue
             cx, cy = self._hex_center(obj.pos[0], obj.pos[1])
-            color = PLAYER_COLORS.get(my_player, "#ffffff")
+            color = my_color
             obj_r = 5 * self.zoom_level
             self.canvas.create_oval(
                 cx - obj_r,
@@ -1452,7 +1491,7 @@ class OverworldGUI:
             if qstate["status"] != "active":
                 continue
             qx, qy = self._hex_center(qstate["pos"][0], qstate["pos"][1])
-            color = PLAYER_COLORS.get(my_player, "#ffffff")
+            color = my_color
             quest_font_size = max(10, int(10 * self.zoom_level))
             self.canvas.create_text(
                 qx,
@@ -1494,10 +1533,24 @@ class OverworldGUI:
         self._update_quest_button()
 
     def _pixel_to_hex(self, px, py):
+        """Return the board hex whose center is nearest to (px, py)."""
+        size = self.HEX_SIZE
+        cols, rows = self.world.COLS, self.world.ROWS
+        # Invert _hex_center. Within one row the nearest center is one of the
+        # two columns around px; rows of one parity share column positions, so
+        # the nearest center is in the nearest row of either parity, all of
+        # which lie within one row of py. Scanning those few candidates in
+        # row-major order keeps the same tie-breaking as a full scan.
+        row_f = (py - 50 - self.view_offset[1]) / (size * 1.5)
+        top = min(max(math.floor(row_f), 0), rows - 2)
         best = None
         best_dist = float("inf")
-        for r in range(self.world.ROWS):
-            for c in range(self.world.COLS):
+        for r in range(max(top - 1, 0), min(top + 3, rows)):
+            col_f = (px - 50 - self.view_offset[0]) / (size * 1.75)
+            if r % 2 == 1:
+                col_f -= 0.5
+            left = min(max(math.floor(col_f), 0), cols - 2)
+            for c in (left, left + 1):
                 cx, cy = self._hex_center(c, r)
                 d = (px - cx) ** 2 + (py - cy) ** 2
                 if d < best_dist:
@@ -1516,7 +1569,7 @@ class OverworldGUI:
         self.view_offset[0] += dx
         self.view_offset[1] += dy
         self._pan_anchor = (event.x, event.y)
-        self._draw()
+        self._request_draw()
 
     def _on_pan_end(self, event):
         self._pan_anchor = None
@@ -1524,7 +1577,7 @@ class OverworldGUI:
     def _pan_by(self, dx, dy):
         self.view_offset[0] += dx
         self.view_offset[1] += dy
-        self._draw()
+        self._request_draw()
 
     def _on_scroll_zoom(self, event):
         # Determine scroll direction
@@ -1565,7 +1618,7 @@ class OverworldGUI:
         self.view_offset[0] += mouse_x - new_screen_x - self.view_offset[0]
         self.view_offset[1] += mouse_y - new_screen_y - self.view_offset[1]
 
-        self._draw()
+        self._request_draw()
 
     def _get_quest_at(self, pos):
         """Return (quest_id, quest_state) for an active quest at pos, or None."""
@@ -1581,17 +1634,31 @@ class OverworldGUI:
         my_faction = (
             self.player_factions.get(my_player) if self._multiplayer else self.faction
         )
-        best = None
-        best_dist = float("inf")
-        for army in self.world.armies:
-            if self._is_hidden_objective_guard(army, my_faction):
-                continue
-            cx, cy = self._hex_center(army.pos[0], army.pos[1])
-            dist_sq = (px - cx) ** 2 + (py - cy) ** 2
-            if dist_sq <= ARMY_RADIUS**2 and dist_sq < best_dist:
-                best_dist = dist_sq
-                best = army
-        return best
+        # Army circles are far smaller than a hex, so a hit can only be an
+        # army on the hex under the pointer; they share that hex's center
+        pos = self._pixel_to_hex(px, py)
+        cx, cy = self._hex_center(pos[0], pos[1])
+        if (px - cx) ** 2 + (py - cy) ** 2 > ARMY_RADIUS**2:
+            return None
+        armies = self._visible_armies_at(pos, my_faction)
+        return armies[0] if armies else None
+
+    def _request_hover(self, event):
+        """Handle the latest pointer motion on the next idle turn.
+
+        <Motion> fires per pixel, so a burst of events between two idle turns
+        is answered once, for the newest position.
+        """
+        scheduled = self._pending_hover is not None
+        self._pending_hover = event
+        if not scheduled:
+            self.root.after_idle(self._flush_hover)
+
+    def _flush_hover(self):
+        event, self._pending_hover = self._pending_hover, None
+        if event is None or not self.canvas.winfo_exists():
+            return  # map view was torn down before the idle callback ran
+        self._on_hover(event)
 
     def _on_hover(self, event):
         army = self._army_at_pixel(event.x, event.y)
@@ -1612,13 +1679,8 @@ class OverworldGUI:
             else:
                 self._hovered_army = army
                 self._hovered_quest_id = quest_info[0] if quest_info else None
-                if self.tooltip:
-                    self.tooltip.destroy()
-                    self.tooltip = None
+                self._hide_hover_tip()
                 if army:
-                    self.tooltip = tw = tk.Toplevel(self.root)
-                    tw.wm_overrideredirect(True)
-                    tw.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
                     header = (
                         f'P{army.player} "{army.moniker}"'
                         if army.moniker
@@ -1634,44 +1696,52 @@ class OverworldGUI:
                     )
                     if army.exhausted:
                         text += "\n  (Exhausted)"
-                    tk.Label(
-                        tw,
-                        text=text,
-                        justify=tk.LEFT,
-                        bg="#ffffdd",
-                        font=("Arial", 10),
-                        padx=6,
-                        pady=4,
-                        relief=tk.SOLID,
-                        borderwidth=1,
-                    ).pack()
+                    self._show_hover_tip(event, text, bg="#ffffdd")
                 elif quest_info:
                     qid, qstate = quest_info
                     quest = qstate["quest"]
-                    self.tooltip = tw = tk.Toplevel(self.root)
-                    tw.wm_overrideredirect(True)
-                    tw.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
                     text = f"{quest['name']}\n{quest['objective']}"
                     if quest.get("wait_turns"):
                         text += (
                             f"\nWaited: {qstate['wait_counter']}/{quest['wait_turns']}"
                         )
-                    tk.Label(
-                        tw,
-                        text=text,
-                        justify=tk.LEFT,
-                        bg="#ddeeff",
-                        font=("Arial", 10),
-                        padx=6,
-                        pady=4,
-                        relief=tk.SOLID,
-                        borderwidth=1,
-                        wraplength=300,
-                    ).pack()
+                    self._show_hover_tip(event, text, bg="#ddeeff", wraplength=300)
         elif self.tooltip:
             if not shift_held:
                 self.tooltip.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
 
+    def _show_hover_tip(self, event, text, bg, wraplength=0):
+        """Show the map hover tooltip near the pointer.
+
+        One borderless window is built on first use and then only withdrawn
+        and re-shown, sparing a window-manager round trip per hover change.
+        """
+        tip = self._hover_tip
+        if tip is None or not tip[0].winfo_exists():
+            tw = tk.Toplevel(self.root)
+            tw.wm_overrideredirect(True)
+            label = tk.Label(
+                tw,
+                justify=tk.LEFT,
+                font=("Arial", 10),
+                padx=6,
+                pady=4,
+                relief=tk.SOLID,
+                borderwidth=1,
+            )
+            label.pack()
+            self._hover_tip = tip = (tw, label)
+        tw, label = tip
+        label.config(text=text, bg=bg, wraplength=wraplength)
+        tw.wm_geometry(f"+{event.x_root + 15}+{event.y_root + 10}")
+        tw.deiconify()
+        self.tooltip = tw
+
+    def _hide_hover_tip(self):
+        if self.tooltip:
+            self.tooltip.withdraw()
+            self.tooltip = None
+
     def _on_shift_release(self, event):
         """Dismiss tooltip when Shift is released if cursor is no longer over the army."""
         if self.tooltip:
@@ -1691,12 +1761,10 @@ class OverworldGUI:
                 else:
                     army = None
                 if army is not self._hovered_army:
-                    self.tooltip.destroy()
-                    self.tooltip = None
+                    self._hide_hover_tip()
                     self._hovered_army = None
             except Exception:
-                self.tooltip.destroy()
-                self.tooltip = None
+                self._hide_hover_tip()
                 self._hovered_army = None
 
     def _is_my_turn(self):
@@ -1752,9 +1820,7 @@ class OverworldGUI:
             return
 
         # Click own base -> build panel only if no own army, or army already selected
-        clicked_base = (
-            self.world.get_base_at(clicked) if hasattr(self.world, "bases") else None
-        )
+        clicked_base = self.world.get_base_at(clicked)
         if clicked_base and clicked_base.player == my_player:
             self.selected_structure = None
             if clicked_army and clicked_army.player == my_player:
@@ -1868,28 +1934,26 @@ class OverworldGUI:
         clicked_armies = self._visible_armies_at(clicked, my_faction)
         clicked_army = self._pick_target_army(clicked_armies, my_player)
         is_own = clicked_army and clicked_army.player == my_player
+        is_enemy = clicked_army and clicked_army.player != my_player
+
+        # Moves stay within ARMY_MOVE_RANGE and attacks end one hex short of
+        # the target, so anything farther fails the search below anyway
+        max_dist = ARMY_MOVE_RANGE + 1 if is_enemy else ARMY_MOVE_RANGE
+        if hex_distance(self.selected_army.pos, clicked) > max_dist:
+            self.status_var.set("Too far. Right-click a highlighted hex to move.")
+            return
 
         # Check reachability within move range
-        occupied = {
-            a.pos
-            for a in self.world.armies
-            if a is not self.selected_army
-            and not self._is_hidden_objective_guard(a, my_faction)
-            and a.pos != clicked
-        }
-        reachable = reachable_hexes(
-            self.selected_army.pos,
-            ARMY_MOVE_RANGE,
-            self.world.COLS,
-            self.world.ROWS,
-            occupied,
+        occupied = blocked_positions(
+            self.world, self.selected_army, my_faction, self.world.get_objective_at
         )
+        occupied.discard(clicked)
+        reachable = self._reachable_from(self.selected_army.pos, occupied)
         if is_own and clicked not in reachable:
             self.status_var.set("Too far. Right-click a highlighted hex to move.")
             return
 
         # Enemy army hexes are valid attack targets even if "occupied"
-        is_enemy = clicked_army and clicked_army.player != my_player
         if clicked not in reachable and not is_enemy:
             self.status_var.set("Too far. Right-click a highlighted hex to move.")
             return
@@ -1899,10 +1963,8 @@ class OverworldGUI:
             adj = hex_neighbors(
                 clicked[0], clicked[1], self.world.COLS, self.world.ROWS
             )
-            adj_reachable = [
-                h for h in adj if h in reachable or h == self.selected_army.pos
-            ]
-            if not adj_reachable:
+            sel_pos = self.selected_army.pos
+            if not any(h in reachable or h == sel_pos for h in adj):
                 self.status_var.set("Too far. Right-click a highlighted hex to move.")
                 return
 
@@ -1968,9 +2030,10 @@ class OverworldGUI:
 
     def _check_local_base_destruction(self, pos, moving_player):
         """Capture enemy base at pos in single-player mode."""
-        for base in getattr(self.world, "bases", []):
-            if base.pos == pos and base.alive and base.player != moving_player:
+        for base in self.world.bases.at(pos):
+            if base.alive and base.player != moving_player:
                 base.player = moving_player
+                self.world.bases_changed()
                 self.status_var.set(f"P{moving_player} captured a base!")
 
     def _any_quest_completable(self):
@@ -2161,8 +2224,6 @@ class OverworldGUI:
 
     def _choose_quest_decision(self, quest_id, decision, dialog):
         """Finalize quest completion with the chosen decision."""
-        from .quest_effects import apply_decision_effects
-
         qstate = self.player_quests[quest_id]
         quest = qstate["quest"]
 
@@ -2255,8 +2316,6 @@ class OverworldGUI:
         Returns:
             The display name (evolved form name or original unit_id)
         """
-        from .heroes import get_hero_display_name
-
         evolutions = self.player_hero_evolutions.get(player_id, {})
         return get_hero_display_name(unit_id, evolutions)
 
@@ -2333,7 +2392,7 @@ class OverworldGUI:
         if self.selected_army:
             self.selected_army = None
             self.status_var.set("Selection cancelled.")
-            self._draw()
+            self._request_draw()
 
     def _on_end_turn(self):
         if self._multiplayer:
@@ -2370,7 +2429,7 @@ class OverworldGUI:
         else:
             self.status_var.set("New turn. Click a P1 army to select it.")
         self._update_gold_display()
-        self._draw()
+        self._request_draw()
 
     def _process_ai_turns(self):
         """Process turns for all AI players."""
@@ -2559,9 +2618,7 @@ class OverworldGUI:
         )
 
         # Hide overworld UI
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        self._hide_hover_tip()
         self.main_frame.pack_forget()
         self.status_var.set("Battle in progress!")
 
@@ -2570,12 +2627,9 @@ class OverworldGUI:
 
         def on_battle_complete(winner, p1_survivors, p2_survivors):
             # Use the GUI's current battle (may differ from original after reset)
-            current_battle = (
-                self._combat_gui.battle
-                if hasattr(self, "_combat_gui") and self._combat_gui
-                else battle
-            )
-            if hasattr(self, "_combat_gui") and self._combat_gui:
+            current_battle = battle
+            if self._combat_gui:
+                current_battle = self._combat_gui.battle
                 self._combat_gui._close_log()
                 self._combat_gui = None
             self.combat_frame.destroy()
@@ -2634,13 +2688,12 @@ class OverworldGUI:
                 }
 
             self.main_frame.pack(fill=tk.BOTH, expand=True)
-            p1_armies = [a for a in self.world.armies if a.player == 1]
-            p2_armies = [a for a in self.world.armies if a.player == 2]
-            p1_bases = [b for b in self.world.bases if b.player == 1 and b.alive]
-            p2_bases = [b for b in self.world.bases if b.player == 2 and b.alive]
-            if not p1_armies and not p1_bases:
+            # Players that still hold an army or a living base
+            present = {a.player for a in self.world.armies}
+            present.update(b.player for b in self.world.bases if b.alive)
+            if 1 not in present:
                 self.status_var.set("Player 2 wins the overworld!")
-            elif not p2_armies and not p2_bases:
+            elif 2 not in present:
                 self.status_var.set("Player 1 wins the overworld!")
             elif winner == 0:
                 self.status_var.set("Battle ended in a stalemate. Both armies survive.")
@@ -2904,10 +2957,14 @@ class OverworldGUI:
 
     def _apply_world_state(self, msg):
         self.world.armies = deserialize_armies(msg["armies"])
-        self.world.bases = deserialize_bases(msg.get("bases", []))
+        # The server leaves out sections unchanged since its last update
+        if "bases" in msg:
+            self.world.bases = deserialize_bases(msg["bases"])
         self.world.gold = {int(k): v for k, v in msg.get("gold", {}).items()}
-        self.world.gold_piles = deserialize_gold_piles(msg.get("gold_piles", []))
-        self.world.objectives = deserialize_objectives(msg.get("objectives", []))
+        if "gold_piles" in msg:
+            self.world.gold_piles = deserialize_gold_piles(msg["gold_piles"])
+        if "objectives" in msg:
+            self.world.objectives = deserialize_objectives(msg["objectives"])
         self.selected_armies = []
         if "player_factions" in msg:
             self.player_factions = self._coerce_int_keys(msg.get("player_factions", {}))
@@ -2937,7 +2994,7 @@ class OverworldGUI:
                 "Click your base to build units."
             ),
         )
-        self._draw()
+        self._request_draw()
 
     def _msg_state_update(self, msg):
         self._apply_world_state(msg)
@@ -2947,7 +3004,7 @@ class OverworldGUI:
         self.selected_army = None
         status = msg.get("message", "")
         self._set_turn_status(status)
-        self._draw()
+        self._request_draw()
 
     def _msg_battle_end(self, msg):
         if self.battle_log is not None:
@@ -3003,7 +3060,7 @@ class OverworldGUI:
             self.combat_frame.destroy()
             self.combat_frame = None
         self.main_frame.pack(fill=tk.BOTH, expand=True)
-        self._draw()
+        self._request_draw()
 
     def _on_replay_click(self, event):
         """Handle double-click on battle log to request replay."""
@@ -3028,9 +3085,7 @@ class OverworldGUI:
 
     def _show_replay(self, msg):
         """Show a battle replay by re-simulating locally with the server's seed."""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        self._hide_hover_tip()
         self.main_frame.pack_forget()
 
         self.combat_frame = tk.Frame(self.root)
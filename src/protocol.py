@@ -85,17 +85,17 @@ def deserialize_armies(data):
     """Convert serialized army dicts back to OverworldArmy objects."""
     from .overworld import OverworldArmy
 
-    armies = []
-    for d in data:
-        armies.append(
-            OverworldArmy(
-                player=d["player"],
-                units=[tuple(u) for u in d["units"]],
-                pos=tuple(d["pos"]),
-                exhausted=d["exhausted"],
-            )
+    # The units setter unpacks each [name, count] pair into its count dict
+    # itself, so the JSON pairs need no conversion to tuples first
+    return [
+        OverworldArmy(
+            player=d["player"],
+            units=d["units"],
+            pos=tuple(d["pos"]),
+            exhausted=d["exhausted"],
         )
-    return armies
+        for d in data
+    ]
 
 
 def deserialize_bases(data):
@@ -46,6 +46,7 @@ def _handle_create_base(effect, context):
         existing.player = player_id
         existing.income = income
         existing.allows_recruitment = allows_recruitment
+        world.bases_changed()
     else:
         world.bases.append(
             Structure(
@@ -65,6 +66,7 @@ def _handle_destroy_base(effect, context):
     base = world.get_base_at(quest_pos)
     if base:
         base.alive = False
+        world.bases_changed()
 
 
 def _handle_destroy_largest_army(effect, context):
@@ -107,15 +109,7 @@ def _handle_add_units(effect, context):
         return
 
     for unit_name, count in units_to_add:
-        # Check if unit type already exists in army
-        found = False
-        for i, (name, existing_count) in enumerate(hero_army.units):
-            if name == unit_name:
-                hero_army.units[i] = (name, existing_count + count)
-                found = True
-                break
-        if not found:
-            hero_army.units.append((unit_name, count))
+        hero_army.add_units(unit_name, count)
 
 
 EFFECT_HANDLERS = {
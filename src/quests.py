@@ -1,7 +1,7 @@
 """Quest definitions and helpers for the Custodian faction."""
 
 from .ability_defs import ability
-from .hex import hex_distance
+from .hex import build_distance_table
 
 
 # Quest-triggered upgrades that can't be obtained via objectives
@@ -471,12 +471,11 @@ def generate_quest_location(quest, overworld, player):
         return best
 
     if rule == "center":
-        center = (overworld.COLS // 2, overworld.ROWS // 2)
+        cols, rows = overworld.COLS, overworld.ROWS
+        center = (cols // 2, rows // 2)
+        center_dists = build_distance_table(cols, rows)[center[1] * cols + center[0]]
         candidates = [
-            (c, r)
-            for r in range(overworld.ROWS)
-            for c in range(overworld.COLS)
-            if hex_distance((c, r), center) <= 3
+            (idx % cols, idx // cols) for idx, d in enumerate(center_dists) if d <= 3
         ]
         return rng.choice(candidates) if candidates else center
 
@@ -545,8 +544,11 @@ def check_quest_completable(quest, quest_state, overworld, player):
     # Clear gold radius
     clear_radius = quest.get("clear_gold_radius", 0)
     if clear_radius > 0:
+        cols = overworld.COLS
+        pos_dists = build_distance_table(cols, overworld.ROWS)[pos[1] * cols + pos[0]]
         for pile in overworld.gold_piles:
-            if hex_distance(pile.pos, pos) <= clear_radius:
+            c, r = pile.pos
+            if pos_dists[r * cols + c] <= clear_radius:
                 return False
 
     # Capture base
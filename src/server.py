@@ -11,7 +11,12 @@ from .compat import setup_frozen_path
 
 from .combat import Battle
 from .constants import NEUTRAL_PLAYER, ARMY_MOVE_RANGE
-from .game_state import get_effective_unit_stats, is_hidden_objective_guard
+from .game_state import (
+    auto_build_evenly,
+    blocked_positions,
+    get_effective_unit_stats,
+    is_hidden_objective_guard,
+)
 from .overworld import (
     Overworld,
     UNIT_STATS,
@@ -20,7 +25,7 @@ from .overworld import (
     OverworldArmy,
 )
 from .battle_resolution import make_battle_units, resolve_battle
-from .hex import hex_neighbors, reachable_hexes
+from .hex import hex_distance, hex_neighbors, reachable_hexes
 from .heroes import get_heroes_for_faction
 from .upgrades import (
     get_upgrades_for_faction,
@@ -105,6 +110,8 @@ class GameServer:
         self._upgrade_selection_order = []  # order of players to pick upgrades
         self._upgrade_selection_idx = 0  # which player is currently picking
         self.ai_players = set()
+        # player_id -> {section: value} of the world sections last sent to them
+        self._last_sent_sections = {}
         self._pending_objective_rewards = {}
         self._effective_stats_cache = {}
         self.player_economy = {}  # player_id -> {"income_bonus": int}
@@ -138,18 +145,24 @@ class GameServer:
                 pass
 
     def _state_update_msg(self, message="", player_id=None):
+        """Build a state update; for a player, unchanged static sections are left out.
+
+        Bases, gold piles and objectives change far less often than armies, so
+        a section equal to the one last sent to that player is omitted and the
+        client keeps what it has.
+        """
         objectives = []
         if player_id is not None:
             objectives = serialize_objectives(self._objectives_for_player(player_id))
         armies = self.world.armies
         if player_id is not None:
             armies = self._armies_for_player(player_id)
-        return {
+        msg = {
             "type": STATE_UPDATE,
             "armies": serialize_armies(armies),
             "bases": serialize_bases(self.world.bases),
             "gold": self.world.gold,
-            "gold_piles": serialize_gold_piles(getattr(self.world, "gold_piles", [])),
+            "gold_piles": serialize_gold_piles(self.world.gold_piles),
             "objectives": objectives,
             "current_player": self.current_player,
             "message": message,
@@ -159,6 +172,14 @@ class GameServer:
             "player_economy": self.player_economy,
             "player_combat_rules": self.player_combat_rules,
         }
+        if player_id is not None:
+            sent = self._last_sent_sections.setdefault(player_id, {})
+            for key in ("bases", "gold_piles", "objectives"):
+                if sent.get(key) == msg[key]:
+                    del msg[key]
+                else:
+                    sent[key] = msg[key]
+        return msg
 
     @staticmethod
     def _format_move_status(kind, player_id, to_pos, gained):
@@ -190,13 +211,11 @@ class GameServer:
         faction = self.player_factions.get(player_id)
         if not faction:
             return []
-        return [
-            o for o in getattr(self.world, "objectives", []) if o.faction == faction
-        ]
+        return [o for o in self.world.objectives if o.faction == faction]
 
     def _armies_for_player(self, player_id):
         faction = self.player_factions.get(player_id)
-        objectives = {o.pos: o.faction for o in getattr(self.world, "objectives", [])}
+        objectives = {o.pos: o.faction for o in self.world.objectives}
         armies = []
         for a in self.world.armies:
             if (
@@ -213,7 +232,7 @@ class GameServer:
         return is_hidden_objective_guard(army, faction, self._objective_at)
 
     def _visible_armies_at(self, pos, player_id):
-        armies = [a for a in self.world.armies if a.pos == pos]
+        armies = self.world.get_armies_at(pos)
         return [a for a in armies if not self._is_hidden_objective_guard(a, player_id)]
 
     @staticmethod
@@ -227,10 +246,7 @@ class GameServer:
         return armies[0] if armies else None
 
     def _objective_at(self, pos):
-        for o in getattr(self.world, "objectives", []):
-            if o.pos == pos:
-                return o
-        return None
+        return self.world.get_objective_at(pos)
 
     def _objective_guard_for_faction_at(self, pos, faction):
         if not faction:
@@ -238,8 +254,8 @@ class GameServer:
         objective = self._objective_at(pos)
         if not objective or objective.faction != faction:
             return None
-        for a in self.world.armies:
-            if a.pos == pos and a.player == NEUTRAL_PLAYER:
+        for a in self.world.get_armies_at(pos):
+            if a.player == NEUTRAL_PLAYER:
                 return a
         return None
 
@@ -358,9 +374,10 @@ class GameServer:
 
     def _check_base_destruction(self, pos, moving_player):
         """Capture any enemy base at the given position."""
-        for base in self.world.bases:
-            if base.pos == pos and base.alive and base.player != moving_player:
+        for base in self.world.bases.at(pos):
+            if base.alive and base.player != moving_player:
                 base.player = moving_player
+                self.world.bases_changed()
 
     async def _check_game_over(self):
         """Check if only one player remains."""
@@ -371,6 +388,16 @@ class GameServer:
             return True
         return False
 
+    @staticmethod
+    def _is_board_pos(pos):
+        """Return True if a client-sent pos is a (col, row) of ints on the board."""
+        return (
+            len(pos) == 2
+            and all(type(v) is int for v in pos)
+            and 0 <= pos[0] < Overworld.COLS
+            and 0 <= pos[1] < Overworld.ROWS
+        )
+
     @staticmethod
     def _validate_fields(msg, *fields):
         """Return list of missing field names."""
@@ -392,10 +419,11 @@ class GameServer:
             )
             return None
 
-        from_pos = tuple(msg["from"])
-        to_pos = tuple(msg["to"])
+        # Positions arrive as JSON lists; anything else fails the board checks
+        from_pos = tuple(msg["from"]) if isinstance(msg["from"], list) else ()
+        to_pos = tuple(msg["to"]) if isinstance(msg["to"], list) else ()
 
-        army = self.world.get_army_at(from_pos)
+        army = self._is_board_pos(from_pos) and self.world.get_army_at(from_pos)
         if not army or army.player != player_id:
             await self.send_to(player_id, {"type": ERROR, "message": "Not your army"})
             return None
@@ -405,15 +433,28 @@ class GameServer:
             )
             return None
 
+        if not self._is_board_pos(to_pos):
+            await self.send_to(
+                player_id, {"type": ERROR, "message": "Out of move range"}
+            )
+            return None
+
         visible_armies = self._visible_armies_at(to_pos, player_id)
         target = self._pick_target_army(visible_armies, player_id)
-        occupied = {
-            a.pos
-            for a in self.world.armies
-            if a.pos != from_pos
-            and a.pos != to_pos
-            and not self._is_hidden_objective_guard(a, player_id)
-        }
+        is_enemy = target and target.player != player_id
+        # Moves stay within ARMY_MOVE_RANGE and attacks end one hex short of
+        # the target, so anything farther fails the search below anyway
+        max_dist = ARMY_MOVE_RANGE + 1 if is_enemy else ARMY_MOVE_RANGE
+        if hex_distance(from_pos, to_pos) > max_dist:
+            await self.send_to(
+                player_id, {"type": ERROR, "message": "Out of move range"}
+            )
+            return None
+        occupied = blocked_positions(
+            self.world, None, self.player_factions.get(player_id), self._objective_at
+        )
+        occupied.discard(from_pos)
+        occupied.discard(to_pos)
         reachable = reachable_hexes(
             from_pos, ARMY_MOVE_RANGE, Overworld.COLS, Overworld.ROWS, occupied
         )
@@ -424,7 +465,6 @@ class GameServer:
             )
             return None
 
-        is_enemy = target and target.player != player_id
         if to_pos not in reachable and not is_enemy:
             await self.send_to(
                 player_id, {"type": ERROR, "message": "Out of move range"}
@@ -725,6 +765,14 @@ class GameServer:
         unit_name = msg.get("unit_name", "")
         base_pos = msg.get("base_pos")
         if base_pos is not None:
+            # Checked before any position lookup, which hashes the value
+            if not isinstance(base_pos, list) or not self._is_board_pos(
+                tuple(base_pos)
+            ):
+                await self.send_to(
+                    player_id, {"type": ERROR, "message": "Invalid base"}
+                )
+                return
             base_pos = tuple(base_pos)
         faction = self.player_factions.get(player_id)
         if faction and unit_name not in FACTIONS[faction]:
@@ -859,6 +907,7 @@ class GameServer:
         finally:
             if player_id and player_id in self.players:
                 del self.players[player_id]
+                self._last_sent_sections.pop(player_id, None)
                 if self.started:
                     await self._broadcast_state(f"P{player_id} disconnected.")
                     await self._check_game_over()
@@ -906,28 +955,7 @@ class GameServer:
         faction = self.player_factions.get(player_id)
         if not faction:
             return
-        names = FACTIONS[faction]
-        spent = {n: 0 for n in names}
-        bases = self.world.get_player_bases(player_id)
-        base_spent = {b.pos: 0 for b in bases}
-        while self.world.gold.get(player_id, 0) > 0:
-            affordable = [
-                n for n in names if UNIT_STATS[n]["value"] <= self.world.gold[player_id]
-            ]
-            if not affordable:
-                break
-            min_spent = min(spent[n] for n in affordable)
-            candidates = [n for n in affordable if spent[n] == min_spent]
-            name = random.choice(candidates)
-            spent[name] += UNIT_STATS[name]["value"]
-            if bases:
-                pos = min(base_spent, key=base_spent.get)
-                err = self.world.build_unit_at_pos(player_id, name, pos)
-                if err:
-                    break
-                base_spent[pos] += UNIT_STATS[name]["value"]
-            else:
-                self.world.build_unit(player_id, name)
+        auto_build_evenly(self.world, player_id, FACTIONS[faction])
 
     async def _handle_objective_capture(self, attacker, defender, ow_winner):
         if defender.player != NEUTRAL_PLAYER or ow_winner != attacker.player:
@@ -1034,6 +1062,7 @@ class GameServer:
         self.world.grant_income(self.current_player)
 
         for pid in self.players:
+            self._last_sent_sections.pop(pid, None)
             await self.send_to(
                 pid,
                 {
@@ -1041,9 +1070,7 @@ class GameServer:
                     "armies": serialize_armies(self._armies_for_player(pid)),
                     "bases": serialize_bases(self.world.bases),
                     "gold": self.world.gold,
-                    "gold_piles": serialize_gold_piles(
-                        getattr(self.world, "gold_piles", [])
-                    ),
+                    "gold_piles": serialize_gold_piles(self.world.gold_piles),
                     "objectives": serialize_objectives(
                         self._objectives_for_player(pid)
                     ),
@@ -202,6 +202,74 @@ class TestGUISkip:
         assert len(gui.battle.history) == 0
 
 
+class TestAutoStepFastForward:
+    def test_max_speed_skips_animations(self, gui):
+        for _ in range(10):
+            gui._speed_up()
+        gui._play_attack_anim = lambda *a: pytest.fail("attack anim played")
+        gui._play_post_attack_anims = lambda *a: pytest.fail("post anims played")
+        gui.auto_running = True
+        for _ in range(20):
+            gui._auto_step()
+        gui.auto_running = False
+        assert gui.battle.history
+
+
+class TestDrawCoalescing:
+    def test_repeated_requests_draw_once(self, gui, tk_root):
+        calls = []
+        gui._draw = lambda: calls.append(1)
+        gui._request_draw()
+        gui._request_draw()
+        gui._request_draw()
+        tk_root.update_idletasks()
+        assert len(calls) == 1
+        assert gui._draw_scheduled is False
+
+    def test_pending_draw_keeps_first_attack_frame(self, gui, tk_root):
+        gui._request_draw()
+        gui._play_attack_anim(
+            {"ranged": True, "attacker_pos": (0, 0), "target_pos": (2, 0)},
+            lambda: None,
+        )
+        tk_root.update_idletasks()
+        assert gui.canvas.find_withtag("anim")
+
+    def test_pending_draw_keeps_first_chained_frame(self, gui, tk_root):
+        gui._request_draw()
+        gui._chain_anims(
+            [gui._make_stat_arrow_anim((1, 1), "#ff4444", -1, "ramp_anim")],
+            lambda: None,
+        )
+        tk_root.update_idletasks()
+        assert gui.canvas.find_withtag("ramp_anim")
+
+
+class TestReset:
+    def test_reset_replays_identically(self):
+        b = Battle(rng_seed=7)
+        initial = [(u.id, u.name, u.pos) for u in b.units]
+        while b.step():
+            pass
+        first_log = list(b.log)
+        b.reset()
+        assert [(u.id, u.name, u.pos) for u in b.units] == initial
+        assert b.winner is None
+        assert not b.history
+        while b.step():
+            pass
+        assert b.log == first_log
+
+    def test_reset_keeps_combat_rules(self):
+        b = Battle(rng_seed=1, p2_combat_rules={"deep_freeze": 5})
+        b.apply_events_immediately = False
+        b.step()
+        b.reset()
+        assert b.p2_combat_rules == {"deep_freeze": 5}
+        assert b.apply_events_immediately is False
+        assert b.round_num == 1
+
+
 # --- New ability tests ---
 
 
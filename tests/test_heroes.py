@@ -0,0 +1,65 @@
+from src.heroes import (
+    HERO_EVOLUTIONS,
+    HERO_STATS,
+    apply_hero_evolutions_to_stats,
+    get_evolved_hero_stats,
+)
+
+
+class TestEvolvedHeroStats:
+    def test_evolution_applies_stat_deltas_and_abilities(self):
+        stats = get_evolved_hero_stats("Accursed", {"Accursed": ["Abolisher"]})
+        base = HERO_STATS["Accursed"]
+        evo = HERO_EVOLUTIONS["Accursed"]["Abolisher"]
+        assert stats["damage"] == base["damage"] + evo["stat_changes"]["damage"]
+        assert stats["range"] == base["range"] + evo["stat_changes"]["range"]
+        assert stats["abilities"] == base["abilities"] + evo["abilities"]
+
+    def test_mutating_result_leaves_base_stats_untouched(self):
+        before = [dict(ab) for ab in HERO_STATS["Accursed"]["abilities"]]
+        stats = get_evolved_hero_stats("Accursed", {"Accursed": ["Wraith"]})
+        stats["max_hp"] = 1
+        stats["abilities"].append({"trigger": "passive", "effect": "armor"})
+        assert HERO_STATS["Accursed"]["max_hp"] == 16
+        assert HERO_STATS["Accursed"]["abilities"] == before
+
+    def test_cached_result_is_not_shared_with_callers(self):
+        evolutions = {"Neophyte": ["Judge"]}
+        first = get_evolved_hero_stats("Neophyte", evolutions)
+        first["damage"] = 0
+        first["abilities"].clear()
+        second = get_evolved_hero_stats("Neophyte", evolutions)
+        assert second["damage"] == HERO_STATS["Neophyte"]["damage"] + 4
+        assert len(second["abilities"]) == 2
+
+    def test_custom_base_stats_bypass_cache(self):
+        evolutions = {"Accursed": ["Wraith"]}
+        custom = {"Accursed": dict(HERO_STATS["Accursed"], max_hp=1)}
+        get_evolved_hero_stats("Accursed", evolutions)
+        assert get_evolved_hero_stats("Accursed", evolutions, custom)["max_hp"] == 9
+
+    def test_unknown_hero_returns_none(self):
+        assert get_evolved_hero_stats("Nobody", {}) is None
+
+    def test_apply_replaces_only_evolved_heroes(self):
+        result = apply_hero_evolutions_to_stats(HERO_STATS, {"Accursed": ["Wraith"]})
+        assert result is not HERO_STATS
+        assert result["Accursed"]["max_hp"] == HERO_STATS["Accursed"]["max_hp"] + 8
+        assert result["Watcher"] == HERO_STATS["Watcher"]
+
+    def test_two_step_path_applies_both_evolutions(self):
+        stats = get_evolved_hero_stats("Accursed", {"Accursed": ["Wraith", "Reaper"]})
+        first = HERO_EVOLUTIONS["Accursed"]["Wraith"]
+        second = HERO_EVOLUTIONS["Wraith"]["Reaper"]
+        assert stats["abilities"] == (
+            HERO_STATS["Accursed"]["abilities"]
+            + first["abilities"]
+            + second["abilities"]
+        )
+
+    def test_invalid_path_stops_at_first_unknown_form(self):
+        valid = get_evolved_hero_stats("Accursed", {"Accursed": ["Wraith"]})
+        invalid = get_evolved_hero_stats(
+            "Accursed", {"Accursed": ["Wraith", "Bogus", "Reaper"]}
+        )
+        assert invalid == valid
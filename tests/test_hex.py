@@ -0,0 +1,95 @@
+from itertools import pairwise
+
+from src.hex import (
+    bfs_distance_field,
+    bfs_next_step,
+    bfs_path,
+    bfs_path_length,
+    build_distance_table,
+    build_neighbor_index_table,
+    build_neighbor_table,
+    hex_distance,
+    hex_neighbors,
+)
+
+
+class TestNeighborTable:
+    def test_neighbors_are_adjacent_and_in_bounds(self):
+        cols, rows = 17, 9
+        for (c, r), nbs in build_neighbor_table(cols, rows).items():
+            for nc, nr in nbs:
+                assert 0 <= nc < cols and 0 <= nr < rows
+                assert hex_distance((c, r), (nc, nr)) == 1
+
+    def test_interior_cell_has_six_neighbors(self):
+        assert len(hex_neighbors(5, 4, 17, 9)) == 6
+        assert len(hex_neighbors(5, 5, 17, 9)) == 6
+
+    def test_corner_cell_is_clipped(self):
+        assert set(hex_neighbors(0, 0, 17, 9)) == {(1, 0), (0, 1)}
+
+    def test_neighbors_are_symmetric(self):
+        table = build_neighbor_table(14, 14)
+        for pos, nbs in table.items():
+            for nb in nbs:
+                assert pos in table[nb]
+
+    def test_index_table_matches_tuple_table(self):
+        cols, rows = 17, 5
+        indexed = build_neighbor_index_table(cols, rows)
+        for (c, r), nbs in build_neighbor_table(cols, rows).items():
+            assert indexed[r * cols + c] == tuple(nr * cols + nc for nc, nr in nbs)
+
+
+class TestBfsPath:
+    def test_path_is_contiguous_and_avoids_occupied(self):
+        occupied = {(3, r) for r in range(8)}
+        path = bfs_path((0, 4), (6, 4), 14, 14, occupied)
+        assert path[0] == (0, 4) and path[-1] == (6, 4)
+        for a, b in pairwise(path):
+            assert hex_distance(a, b) == 1
+        assert not occupied.intersection(path)
+
+    def test_walled_off_goal_returns_none(self):
+        occupied = {(3, r) for r in range(14)}
+        assert bfs_path((0, 4), (6, 4), 14, 14, occupied) is None
+
+    def test_next_step_is_first_hex_of_path(self):
+        step = bfs_next_step((0, 4), (6, 4), set(), 14, 14)
+        assert hex_distance((0, 4), step) == 1
+        assert hex_distance(step, (6, 4)) == 5
+
+    def test_adjacent_goal_is_returned_even_if_occupied(self):
+        assert bfs_next_step((4, 4), (5, 4), {(5, 4), (3, 4)}, 14, 14) == (5, 4)
+
+
+class TestBfsPathLength:
+    def test_length_matches_path_around_wall(self):
+        occupied = {(3, r) for r in range(8)} | {(6, r) for r in range(3, 14)}
+        for goal in [(9, 0), (9, 13), (4, 12), (6, 4)]:
+            path = bfs_path((0, 4), goal, 14, 14, occupied)
+            expected = len(path) - 1
+            assert bfs_path_length((0, 4), goal, occupied, 14, 14) == expected
+
+    def test_enclosed_goal_is_unreachable(self):
+        occupied = set(hex_neighbors(7, 7, 14, 14))
+        assert bfs_path_length((0, 0), (7, 7), occupied, 14, 14) == 9999
+
+    def test_distance_field_matches_per_goal_lengths(self):
+        cols, rows = 14, 14
+        occupied = {(3, r) for r in range(8)} | {(9, 9), (5, 2)}
+        field = bfs_distance_field((0, 4), cols, rows, occupied)
+        for goal in [(9, 9), (5, 2), (13, 0), (3, 8), (2, 2)]:
+            length = bfs_path_length((0, 4), goal, occupied, cols, rows)
+            assert field[goal[1] * cols + goal[0]] == length
+
+
+class TestDistanceTable:
+    def test_table_matches_hex_distance(self):
+        cols, rows = 14, 14
+        table = build_distance_table(cols, rows)
+        cells = [(c, r) for r in range(rows) for c in range(cols)]
+        for a in cells[::7]:
+            row = table[a[1] * cols + a[0]]
+            for b in cells:
+                assert row[b[1] * cols + b[0]] == hex_distance(a, b)
@@ -1,4 +1,13 @@
-from src.overworld import Overworld, UNIT_STATS
+from src.constants import NEUTRAL_PLAYER
+from src.game_state import auto_build_evenly, blocked_positions
+from src.overworld import (
+    FACTIONS,
+    Base,
+    Objective,
+    Overworld,
+    OverworldArmy,
+    UNIT_STATS,
+)
 
 
 class TestAddUnitsToArmy:
@@ -75,3 +84,157 @@ class TestGoldCollection:
         )
         collected = ow.collect_gold_at(empty_pos, 1)
         assert collected == 0
+
+
+class TestPositionIndex:
+    def test_index_follows_move_and_remove(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((3, 3), 1, "Page", 1)
+        army = ow.get_army_at((3, 3))
+        ow.move_army(army, (4, 4))
+        assert ow.get_army_at((3, 3)) is None
+        assert ow.get_army_at((4, 4)) is army
+        ow.armies.remove(army)
+        assert ow.get_armies_at((4, 4)) == []
+
+    def test_first_army_at_pos_matches_list_order(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((2, 2), 1, "Page", 1)
+        ow._add_units_to_army((5, 5), 2, "Page", 1)
+        first = ow.get_army_at((2, 2))
+        ow.move_army(ow.get_army_at((5, 5)), (2, 2))
+        assert ow.get_army_at((2, 2)) is first
+        assert [a.player for a in ow.get_armies_at((2, 2))] == [1, 2]
+
+    def test_remove_takes_the_given_army_among_equal_ones(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        first = OverworldArmy(player=1, units=[("Page", 1)], pos=(3, 3))
+        second = OverworldArmy(player=1, units=[("Page", 1)], pos=(3, 3))
+        ow.armies.extend([first, second])
+        assert second in ow.armies
+        ow.armies.remove(second)
+        assert list(ow.armies) == [first]
+        assert ow.armies[0] is first
+        assert ow.get_armies_at((3, 3)) == [first]
+        assert ow.get_armies_at((3, 3))[0] is first
+
+    def test_positions_match_army_positions(self):
+        ow = Overworld(num_players=2, rng_seed=5)
+        assert set(ow.armies.positions()) == {a.pos for a in ow.armies}
+        army = ow.armies[0]
+        ow.move_army(army, (13, 13))
+        assert set(ow.armies.positions()) == {a.pos for a in ow.armies}
+
+    def test_assigned_lists_are_indexed(self):
+        ow = Overworld(num_players=2)
+        restored = Overworld.from_dict(ow.to_dict())
+        for base in ow.bases:
+            if base.alive:
+                assert restored.get_base_at(base.pos) == base
+        for pile in ow.gold_piles:
+            assert restored.get_gold_pile_at(pile.pos) == pile
+
+
+class TestPlayerBases:
+    def test_income_follows_capture_and_destruction(self):
+        ow = Overworld(num_players=2, rng_seed=3)
+        base = ow.get_player_base(2)
+        income = ow.grant_income(1)
+        base.player = 1
+        ow.bases_changed()
+        assert ow.grant_income(1) == income + base.income
+        assert base in ow.get_player_bases(1)
+        base.alive = False
+        ow.bases_changed()
+        assert ow.grant_income(1) == income
+        assert base not in ow.get_player_bases(1)
+
+    def test_appended_base_counts_immediately(self):
+        ow = Overworld(num_players=2, rng_seed=3)
+        income = ow.grant_income(1)
+        ow.bases.append(Base(player=1, pos=(0, 13), income=7))
+        assert ow.grant_income(1) == income + 7
+
+
+class TestMergeArmies:
+    def test_merge_sums_counts_and_removes_source(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((3, 3), 1, "Page", 2)
+        ow._add_units_to_army((3, 3), 1, "Librarian", 1)
+        target = ow.get_army_at((3, 3))
+        ow._add_units_to_army((4, 4), 1, "Librarian", 3)
+        source = ow.get_army_at((4, 4))
+        ow.merge_armies(target, source)
+        assert target.units == [("Page", 2), ("Librarian", 4)]
+        assert target.total_count == 6
+        assert ow.get_army_at((4, 4)) is None
+
+    def test_assigning_units_replaces_counts(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((3, 3), 1, "Page", 2)
+        army = ow.get_army_at((3, 3))
+        army.units = [("Steward", 1)]
+        ow._add_units_to_army((3, 3), 1, "Steward", 1)
+        assert army.units == [("Steward", 2)]
+        assert army.total_count == 2
+        assert army.label == "2 Steward"
+
+    def test_label_follows_added_units(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((3, 3), 1, "Page", 2)
+        army = ow.get_army_at((3, 3))
+        assert army.label == "2 Page"
+        ow._add_units_to_army((3, 3), 1, "Librarian", 1)
+        assert army.label == "2 Page + 1 Librarian"
+        assert army.total_count == 3
+
+
+class TestAutoBuild:
+    def test_spends_until_nothing_is_affordable(self):
+        ow = Overworld(num_players=2, rng_seed=4)
+        names = FACTIONS["Custodians"]
+        ow.gold[1] = 100
+        auto_build_evenly(ow, 1, names)
+        assert ow.gold[1] < min(UNIT_STATS[n]["value"] for n in names)
+        built = sum(a.total_count for a in ow.armies if a.player == 1)
+        assert built > 0
+
+    def test_player_without_bases_keeps_gold(self):
+        ow = Overworld(num_players=2, rng_seed=4)
+        for base in ow.get_player_bases(1):
+            base.alive = False
+        ow.bases_changed()
+        ow.gold[1] = 50
+        auto_build_evenly(ow, 1, FACTIONS["Custodians"])
+        assert ow.gold[1] == 50
+
+
+class TestBlockedPositions:
+    def test_skips_mover_and_hidden_guards(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow.objectives = [Objective(pos=(6, 6), faction="Weavers")]
+        ow._add_units_to_army((3, 3), 1, "Page", 1)
+        ow._add_units_to_army((4, 4), 2, "Page", 1)
+        ow._add_units_to_army((6, 6), NEUTRAL_PLAYER, "Page", 1)
+        mover = ow.get_army_at((3, 3))
+        blocked = blocked_positions(ow, mover, "Custodians", ow.get_objective_at)
+        assert blocked == {(4, 4)}
+        blocked = blocked_positions(ow, mover, "Weavers", ow.get_objective_at)
+        assert blocked == {(4, 4), (6, 6)}
+
+    def test_other_army_on_movers_hex_still_blocks(self):
+        ow = Overworld(num_players=2)
+        ow.armies.clear()
+        ow._add_units_to_army((3, 3), 1, "Page", 1)
+        mover = ow.get_army_at((3, 3))
+        ow._add_units_to_army((5, 5), 1, "Page", 1)
+        ow.move_army(ow.get_army_at((5, 5)), (3, 3))
+        blocked = blocked_positions(ow, mover, None, ow.get_objective_at)
+        assert blocked == {(3, 3)}
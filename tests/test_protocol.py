@@ -1,4 +1,5 @@
-from src.protocol import encode, decode
+from src.overworld import OverworldArmy
+from src.protocol import decode, deserialize_armies, encode, serialize_armies
 
 
 class TestEncodeDecode:
@@ -21,3 +22,16 @@ class TestEncodeDecode:
     def test_roundtrip_empty(self):
         msg = {}
         assert decode(encode(msg)) == msg
+
+
+class TestArmySerialization:
+    def test_armies_survive_json_roundtrip(self):
+        armies = [
+            OverworldArmy(player=1, units=[("Page", 5), ("Steward", 1)], pos=(1, 2)),
+            OverworldArmy(player=2, units=[("Golem", 2)], pos=(3, 4), exhausted=True),
+        ]
+        data = decode(encode(serialize_armies(armies)))
+        restored = deserialize_armies(data)
+        assert [a.units for a in restored] == [a.units for a in armies]
+        assert [a.pos for a in restored] == [(1, 2), (3, 4)]
+        assert [a.exhausted for a in restored] == [False, True]
@@ -101,6 +101,7 @@ class TestCreateBase:
         quest_pos = (7, 7)
         # Add an existing base owned by player 2
         world.bases.append(Base(player=2, pos=quest_pos, alive=True))
+        assert world.get_base_at(quest_pos) in world.get_player_bases(2)
         context = _make_context(world=world, quest_pos=quest_pos)
 
         effect = {"type": "create_base", "income": 20}
@@ -109,6 +110,8 @@ class TestCreateBase:
         base = world.get_base_at(quest_pos)
         assert base is not None
         assert base.player == 1
+        assert base in world.get_player_bases(1)
+        assert base not in world.get_player_bases(2)
 
 
 class TestDestroyBase:
@@ -118,6 +121,8 @@ class TestDestroyBase:
         # Remove any existing base at the quest position (e.g., neutral structures)
         world.bases = [b for b in world.bases if b.pos != quest_pos]
         world.bases.append(Base(player=1, pos=quest_pos, alive=True))
+        target = world.get_base_at(quest_pos)
+        assert target in world.get_player_bases(1)
         context = _make_context(world=world, quest_pos=quest_pos)
 
         effect = {"type": "destroy_base"}
@@ -125,6 +130,7 @@ class TestDestroyBase:
 
         base = world.get_base_at(quest_pos)
         assert base is None  # get_base_at returns None if not alive
+        assert target not in world.get_player_bases(1)
 
     def test_destroy_base_no_base_is_noop(self):
         world = Overworld(num_players=4)
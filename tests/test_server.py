@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from src.overworld import Overworld
+from src.server import GameServer
+
+
+def _started_server():
+    """Return a started server on a fresh world whose errors are recorded."""
+    server = GameServer()
+    server.world = Overworld(num_players=2, rng_seed=1)
+    server.started = True
+    server.current_player = 1
+    server.errors = []
+
+    async def send_to(player_id, msg):
+        server.errors.append(msg.get("message"))
+
+    server.send_to = send_to
+    return server
+
+
+class TestMoveValidation:
+    @pytest.mark.parametrize(
+        "to", [[1], ["a", "b"], 5, [99, 3], [True, 1], [[1], [2]], [-1, 0]]
+    )
+    def test_malformed_destination_is_out_of_range(self, to):
+        server = _started_server()
+        server.world.armies.clear()
+        server.world._add_units_to_army((3, 3), 1, "Page", 1)
+        msg = {"from": [3, 3], "to": to}
+        assert asyncio.run(server._validate_move_request(1, msg)) is None
+        assert server.errors == ["Out of move range"]
+
+    @pytest.mark.parametrize("frm", [[1], 5, [[1], [2]]])
+    def test_malformed_source_is_not_your_army(self, frm):
+        server = _started_server()
+        msg = {"from": frm, "to": [1, 1]}
+        assert asyncio.run(server._validate_move_request(1, msg)) is None
+        assert server.errors == ["Not your army"]
+
+    def test_valid_move_passes(self):
+        server = _started_server()
+        server.world.armies.clear()
+        server.world._add_units_to_army((3, 3), 1, "Page", 1)
+        msg = {"from": [3, 3], "to": [4, 3]}
+        result = asyncio.run(server._validate_move_request(1, msg))
+        assert result["to_pos"] == (4, 3)
+        assert server.errors == []
+
+
+class TestBuildValidation:
+    @pytest.mark.parametrize("base_pos", [[[0], [1]], [1], "ab", 5, [99, 0]])
+    def test_malformed_base_is_invalid(self, base_pos):
+        server = _started_server()
+        gold = dict(server.world.gold)
+        msg = {"unit_name": "Page", "base_pos": base_pos}
+        asyncio.run(server._handle_build_unit(1, msg))
+        assert server.errors == ["Invalid base"]
+        assert server.world.gold == gold